@@ -38,7 +38,7 @@ from traits.api import (
     property_depends_on,
 )
 
-from acoular.h5files import H5FileBase, _get_h5file_class
+from acoular.h5files import H5FileBase, _close_h5file, _open_h5file
 from acoular.internal import digest
 from acoular.microphones import MicGeom
 from acoular.sources import TimeSamples
@@ -118,9 +118,8 @@ class CsmAIAABenchmark(PowerSpectraImport):
         """Open the .h5 file and set attributes."""
         if self.h5f is not None:
             with contextlib.suppress(OSError):
-                self.h5f.close()
-        file = _get_h5file_class()
-        self.h5f = file(self.file)
+                _close_h5file(self.h5f)
+        self.h5f = _open_h5file(self.file)
 
     # @property_depends_on( 'block_size, ind_low, ind_high' )
     def _get_indices(self):
@@ -144,7 +143,12 @@ class CsmAIAABenchmark(PowerSpectraImport):
         csmim = self.h5f.get_data_by_reference('/CsmData/csmImaginary')[:].transpose((2, 0, 1))
         csmdatagroup = self.h5f.get_data_by_reference('/CsmData')
         sign = self.h5f.get_node_attribute(csmdatagroup, 'fftSign')
-        return csmre + sign * 1j * csmim
+        # fill real and imaginary parts of a C-contiguous (frequencies, mics, mics) array directly
+        csm = np.empty(csmre.shape, dtype=complex)
+        csm.real = csmre
+        csm.imag = csmim
+        csm.imag *= sign
+        return csm
 
     def fftfreq(self):
         """Return the Discrete Fourier Transform sample frequencies.
@@ -177,7 +181,8 @@ class MicAIAABenchmark(MicGeom):
 
         Called when :attr:`basename` changes.
         """
-        file = _get_h5file_class()
-        h5f = file(self.file, mode='r')
-        self.pos_total = h5f.get_data_by_reference('MetaData/ArrayAttributes/microphonePositionsM')[:].swapaxes(0, 1)
-        h5f.close()
+        h5f = _open_h5file(self.file)
+        self.pos_total = np.ascontiguousarray(
+            h5f.get_data_by_reference('MetaData/ArrayAttributes/microphonePositionsM')[:].swapaxes(0, 1)
+        )
+        _close_h5file(h5f)
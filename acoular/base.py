@@ -66,6 +66,7 @@ class Generator(ABCHasStrictTraits):
     # internal identifier
     digest = Property(depends_on=['sample_freq', 'num_samples', 'num_channels'])
 
+    @cached_property
     def _get_digest(self):
         return digest(self)
 
@@ -99,6 +100,7 @@ class SamplesGenerator(Generator):
     # internal identifier
     digest = Property(depends_on=['sample_freq', 'num_samples', 'num_channels'])
 
+    @cached_property
     def _get_digest(self):
         return digest(self)
 
@@ -140,6 +142,7 @@ class SpectraGenerator(Generator):
     # internal identifier
     digest = Property(depends_on=['sample_freq', 'num_samples', 'num_channels', 'num_freqs', 'block_size'])
 
+    @cached_property
     def _get_digest(self):
         return digest(self)
 
@@ -16,7 +16,7 @@
 """
 
 # imports from other packages
-import xml.dom.minidom
+from xml.etree import ElementTree
 
 import numpy as np
 from traits.api import CArray, CInt, File, List, Property, Union, cached_property, observe
@@ -119,13 +119,8 @@ class Calib(InOut):
     @observe('file')
     def _import_data(self, event):  # noqa ARG002
         """Loads the calibration data from `*.xml` file ."""
-        doc = xml.dom.minidom.parse(self.file)
-        names = []
-        data = []
-        for element in doc.getElementsByTagName('pos'):
-            names.append(element.getAttribute('Name'))
-            data.append(float(element.getAttribute('factor')))
-        self.data = np.array(data, 'd')
+        elements = list(ElementTree.parse(self.file).iter('pos'))
+        self.data = np.fromiter((float(el.get('factor', '')) for el in elements), dtype=float, count=len(elements))
         self.num_mics = self.data.shape[0]
 
     def __validate_data(self):
@@ -133,6 +133,9 @@ class Config(HasStrictTraits):
     #: Boolean Flag that determines whether pylops is installed.
     have_pylops = Property()
 
+    #: Boolean Flag that determines whether cupy is installed.
+    have_cupy = Property()
+
     #: Boolean Flag that determines whether sounddevice is installed.
     have_sounddevice = Property()
 
@@ -198,6 +201,10 @@ class Config(HasStrictTraits):
     def _get_have_pylops(self):
         return self._have_module('pylops')
 
+    @cached_property
+    def _get_have_cupy(self):
+        return self._have_module('cupy')
+
     @cached_property
     def _get_have_sounddevice(self):
         return self._have_module('sounddevice')
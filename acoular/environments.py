@@ -188,6 +188,7 @@ class Environment(HasStrictTraits):
     #: Default is :obj:`None`.
     roi = Union(None, CArray)
 
+    @cached_property
     def _get_digest(self):
         return digest(self)
 
@@ -809,7 +810,7 @@ class GeneralFlowEnvironment(Environment):
 
     #: A unique identifier based on the environment properties. (read-only)
     digest = Property(
-        depends_on=['c', 'ff.digest', 'N', 'Om'],
+        depends_on=['c', 'ff.digest', 'N', 'Om', 'roi'],
     )
 
     #: A dictionary for storing precomputed interpolators to optimize repeated calculations.
@@ -11,6 +11,14 @@ CACHED_OPTION = True  # if True: saves the numba func as compiled func in sub di
 # for calculating on GPU
 PARALLEL_OPTION = 'parallel'
 FAST_OPTION = True  # fastmath options
+# maximum number of chunks the grid is split into in parallel loops, a chunk shares one buffer
+NUM_GRID_CHUNKS = 256
+# number of gridpoints that are evaluated in one matrix product with custom steering vectors
+GRID_BLOCK_SIZE = 2048
+# read-only distance arrays, as the grid to microphone distances are shared between steering
+# vectors; writeable arrays are converted to these types as well
+_dist_1d = nb.types.Array(nb.float64, 1, 'C', readonly=True)
+_dist_2d = nb.types.Array(nb.float64, 2, 'C', readonly=True)
 
 
 # Formerly known as 'faverage'
@@ -54,7 +62,7 @@ def calcCSM(csm, SpecAllMics):
     return csm
 
 
-def beamformerFreq(steerVecType, boolRemovedDiagOfCSM, normFactor, inputTupleSteer, inputTupleCsm):
+def beamformerFreq(steerVecType, boolRemovedDiagOfCSM, normFactor, inputTupleSteer, inputTupleCsm, useGpu=False):
     r"""
     Conventional beamformer in frequency domain.
 
@@ -88,16 +96,21 @@ def beamformerFreq(steerVecType, boolRemovedDiagOfCSM, normFactor, inputTupleSte
     inputTupleCsm : contains the data of measurement as a tuple. There are 2 cases:
         perform standard CSM-beamformer:
             inputTupleCsm = csm
-                csm : complex128[ nMics, nMics]
+                csm : complex128[ nMics, nMics] or complex64[ nMics, nMics]
                     The cross spectral matrix for one frequency
         perform beamformer on eigenvalue decomposition of csm:
             inputTupleCsm = (eigValues, eigVectors)    , with
-                eigValues : float64[nEV]
+                eigValues : float64[nEV] or float32[nEV]
                     nEV is the number of eigenvalues which should be taken into account.
                     All passed eigenvalues will be evaluated.
-                eigVectors : complex128[nMics, nEV]
+                eigVectors : complex128[nMics, nEV] or complex64[nMics, nEV]
                     Eigen vectors corresponding to eigValues. All passed eigenvector slices will be
                     evaluated.
+        Single precision input is used as it is, the beamformer is evaluated in double precision.
+    useGpu : bool
+        Evaluate the beamformer on the GPU with CuPy, which must be installed. The predefined
+        steering vectors are built on the GPU from the distances, which may also be given as CuPy
+        arrays. Defaults to False.
 
     Returns
     -------
@@ -123,6 +136,14 @@ def beamformerFreq(steerVecType, boolRemovedDiagOfCSM, normFactor, inputTupleSte
         distArrayCenterGrid)", but as the steering vector gets multiplied with its complex
         conjugation in all beamformer routines, the constant "distArrayCenterGrid" cancels out -->
         In order to save operations, it is not implemented.
+    Complex exponential:
+        As the wave number is real, "exp(-1j * waveNumber * dist)" is evaluated as
+        "cos(arg) - 1j * sin(arg)" of the single precision argument "arg = waveNumber * dist". This
+        avoids the more expensive complex exponential, which would additionally evaluate "exp(0)".
+    Custom steering vector:
+        With a custom steering vector, the beamformer is evaluated for all gridpoints at once via a
+        matrix product of the steering vectors and the CSM (or its eigenvectors), which is done by
+        BLAS.
     Spectral decomposition of the CSM:
         In Linear Algebra the spectral decomposition of the CSM matrix would be:
 
@@ -145,14 +166,6 @@ def beamformerFreq(steerVecType, boolRemovedDiagOfCSM, normFactor, inputTupleSte
         implemented here.
     """
     boolIsEigValProb = isinstance(inputTupleCsm, tuple)  # len(inputTupleCsm) > 1
-    # get the beamformer type
-    # (key-tuple = (isEigValProblem, formulationOfSteeringVector, RemovalOfCSMDiag))
-    beamformerDict = {
-        (False, 'custom', False): _freqBeamformer_SpecificSteerVec_FullCSM,
-        (False, 'custom', True): _freqBeamformer_SpecificSteerVec_CsmRemovedDiag,
-        (True, 'custom', False): _freqBeamformer_EigValProb_SpecificSteerVec_FullCSM,
-        (True, 'custom', True): _freqBeamformer_EigValProb_SpecificSteerVec_CsmRemovedDiag,
-    }
     sth = {'classic': 1, 'inverse': 2, 'true level': 3, 'true location': 4}
 
     # prepare Input
@@ -169,22 +182,39 @@ def beamformerFreq(steerVecType, boolRemovedDiagOfCSM, normFactor, inputTupleSte
     else:
         csm = inputTupleCsm
 
-    # beamformer routine: parallelized over Gridpoints
-    beamformOutput = np.zeros(nGridPoints, np.float64)
-    steerNormalizeOutput = np.zeros_like(beamformOutput)
-    result = np.zeros(nGridPoints, np.float64)
-    normalHelp = np.zeros_like(result)
-    if steerVecType == 'custom':  # beamformer with custom steering vector
-        coreFunc = beamformerDict[(boolIsEigValProb, steerVecType, boolRemovedDiagOfCSM)]
+    # beamformer routine: parallelized over Gridpoints, all routines write every gridpoint
+    result = np.empty(nGridPoints, np.float64)
+    normalHelp = np.empty_like(result)
+    if useGpu:
+        if boolIsEigValProb:  # the csm is rebuilt from the given eigenvalues and eigenvectors
+            csm = (eigVec * eigVal) @ eigVec.conj().T
+        if steerVecType == 'custom':
+            _freqBeamformer_Gpu(csm, steerVec, 0, normFactor, boolRemovedDiagOfCSM, result, normalHelp)
+        else:
+            _freqBeamformer_Gpu(
+                csm,
+                (distGridToArrayCenter, distGridToAllMics, waveNumber[0]),
+                sth[steerVecType],
+                normFactor,
+                boolRemovedDiagOfCSM,
+                result,
+                normalHelp,
+            )
+    elif steerVecType == 'custom':  # beamformer with custom steering vector
         if boolIsEigValProb:
-            coreFunc(eigVal, eigVec, steerVec, normFactor, result, normalHelp)
+            _freqBeamformer_EigValProb_SpecificSteerVec(
+                eigVal, eigVec, steerVec, normFactor, boolRemovedDiagOfCSM, result, normalHelp
+            )
         else:
-            coreFunc(csm, steerVec, normFactor, result, normalHelp)
+            _freqBeamformer_SpecificSteerVec_Csm(csm, steerVec, normFactor, boolRemovedDiagOfCSM, result, normalHelp)
     else:  # predefined beamformers (Formulation I - IV)
         if boolIsEigValProb:
+            # single precision eigenvectors are used as they are, with eigenvalues of matching type
+            eigValType = np.float32 if eigVec.dtype == np.complex64 else np.float64
+            eigVecType = np.complex64 if eigVec.dtype == np.complex64 else np.complex128
             _freqBeamformer_EigValues(
-                eigVal,
-                np.ascontiguousarray(eigVec),
+                np.ascontiguousarray(eigVal, dtype=eigValType),
+                np.ascontiguousarray(eigVec, dtype=eigVecType),
                 distGridToArrayCenter,
                 distGridToAllMics,
                 waveNumber[0],
@@ -206,25 +236,24 @@ def beamformerFreq(steerVecType, boolRemovedDiagOfCSM, normFactor, inputTupleSte
                 result,
                 normalHelp,
             )
-    beamformOutput = result
-    steerNormalizeOutput = normalHelp
-    return beamformOutput, steerNormalizeOutput
+    return result, normalHelp
 
 
 # fast implementation of full matrix beamformers
 @nb.njit(
     [
         (
-            nb.complex128[:, ::1],
-            nb.float64[::1],
-            nb.float64[:, ::1],
+            csm_type[:, ::1],
+            _dist_1d,
+            _dist_2d,
             nb.float64,
             nb.float64,
             nb.boolean,
             nb.int64,
             nb.float64[::1],
             nb.float64[::1],
-        ),
+        )
+        for csm_type in (nb.complex128, nb.complex64)
     ],
     cache=CACHED_OPTION,
     parallel=True,
@@ -247,79 +276,84 @@ def _freqBeamformer_FullCSM(
     st2 = steer_type == 2
     st34 = steer_type == 3 or steer_type == 4
     helpNormalize = 0.0  # just a hint for the compiler
-    for gi in nb.prange(distGridToArrayCenter.shape[0]):
+    # the grid is split into chunks, so that the steering vector buffer is only allocated per chunk
+    nGridPoints = distGridToArrayCenter.shape[0]
+    chunkSize = max(1, -(-nGridPoints // NUM_GRID_CHUNKS))
+    for cntChunk in nb.prange(-(-nGridPoints // chunkSize)):
         steerVec = np.empty((nMics), np.complex128)
-        # building steering vector: in order to save some operation -> some normalization steps are
-        # applied after mat-vec-multipl.
-        for cntMics in range(nMics):
-            expArg = np.float32(waveNumber * distGridToAllMics[gi, cntMics])
-            steerVec[cntMics] = np.cos(expArg) - 1j * np.sin(expArg)
-        if st2:
-            helpNormalize = 0.0
+        for gi in range(cntChunk * chunkSize, min((cntChunk + 1) * chunkSize, nGridPoints)):
+            # building steering vector: in order to save some operation -> some normalization steps
+            # are applied after mat-vec-multipl.
             for cntMics in range(nMics):
-                helpNormalize += distGridToAllMics[gi, cntMics] * distGridToAllMics[gi, cntMics]
-                # r_{t,i}-normalization is handled here
-                steerVec[cntMics] *= distGridToAllMics[gi, cntMics]
-        if st34:
-            helpNormalize = 0.0
-            for cntMics in range(nMics):
-                helpNormalize += 1.0 / (distGridToAllMics[gi, cntMics] * distGridToAllMics[gi, cntMics])
-                # r_{t,i}-normalization is handled here
-                steerVec[cntMics] /= distGridToAllMics[gi, cntMics]
+                expArg = np.float32(waveNumber * distGridToAllMics[gi, cntMics])
+                steerVec[cntMics] = np.cos(expArg) - 1j * np.sin(expArg)
+            if st2:
+                helpNormalize = 0.0
+                for cntMics in range(nMics):
+                    helpNormalize += distGridToAllMics[gi, cntMics] * distGridToAllMics[gi, cntMics]
+                    # r_{t,i}-normalization is handled here
+                    steerVec[cntMics] *= distGridToAllMics[gi, cntMics]
+            if st34:
+                helpNormalize = 0.0
+                for cntMics in range(nMics):
+                    helpNormalize += 1.0 / (distGridToAllMics[gi, cntMics] * distGridToAllMics[gi, cntMics])
+                    # r_{t,i}-normalization is handled here
+                    steerVec[cntMics] /= distGridToAllMics[gi, cntMics]
 
-        # performing matrix-vector-multiplication (see bottom of information header of
-        # 'beamformerFreq)
-        scalarProd = 0.0
-        for cntMics in range(nMics):
-            leftVecMatrixProd = 0.0 + 0.0j
-            for cntMics2 in range(
-                cntMics,
-            ):  # calculate 'steer^H * CSM' of upper-triangular-part of csm (without diagonal)
-                leftVecMatrixProd += csm[cntMics2, cntMics] * steerVec[cntMics2].conjugate()
-            scalarProd += (
-                2 * (leftVecMatrixProd * steerVec[cntMics]).real
-            )  # use that csm is Hermitian (lower triangular of csm can be reduced to factor '2')
-        if not r_diag:
+            # performing matrix-vector-multiplication (see bottom of information header of
+            # 'beamformerFreq)
+            scalarProd = 0.0
             for cntMics in range(nMics):
+                leftVecMatrixProd = 0.0 + 0.0j
+                for cntMics2 in range(
+                    cntMics,
+                ):  # calculate 'steer^H * CSM' of upper-triangular-part of csm (without diagonal)
+                    leftVecMatrixProd += csm[cntMics2, cntMics] * steerVec[cntMics2].conjugate()
                 scalarProd += (
-                    csm[cntMics, cntMics] * steerVec[cntMics].conjugate() * steerVec[cntMics]
-                ).real  # include diagonal of csm
-
-        # specific normalzation for different steering vector formulations
-        if steer_type == 1:
-            normalizeFactor = nMics
-            normalizeSteer[gi] = 1.0 / nMics
-            result[gi] = scalarProd / (normalizeFactor * normalizeFactor) * signalLossNormalization
-        elif steer_type == 2:
-            normalizeFactor = nMics * distGridToArrayCenter[gi]
-            normalizeFactorSquared = normalizeFactor * normalizeFactor
-            normalizeSteer[gi] = helpNormalize / normalizeFactorSquared
-            result[gi] = scalarProd / normalizeFactorSquared * signalLossNormalization
-        elif steer_type == 3:
-            normalizeFactor = distGridToArrayCenter[gi] * helpNormalize
-            normalizeSteer[gi] = 1.0 / (distGridToArrayCenter[gi] * distGridToArrayCenter[gi]) / helpNormalize
-            result[gi] = scalarProd / (normalizeFactor * normalizeFactor) * signalLossNormalization
-        elif steer_type == 4:
-            normalizeFactor = nMics * helpNormalize
-            normalizeSteer[gi] = 1.0 / nMics
-            result[gi] = scalarProd / normalizeFactor * signalLossNormalization
+                    2 * (leftVecMatrixProd * steerVec[cntMics]).real
+                )  # use that csm is Hermitian (lower triangular of csm can be reduced to factor '2')
+            if not r_diag:
+                for cntMics in range(nMics):
+                    scalarProd += (
+                        csm[cntMics, cntMics] * steerVec[cntMics].conjugate() * steerVec[cntMics]
+                    ).real  # include diagonal of csm
+
+            # specific normalzation for different steering vector formulations
+            if steer_type == 1:
+                normalizeFactor = nMics
+                normalizeSteer[gi] = 1.0 / nMics
+                result[gi] = scalarProd / (normalizeFactor * normalizeFactor) * signalLossNormalization
+            elif steer_type == 2:
+                normalizeFactor = nMics * distGridToArrayCenter[gi]
+                normalizeFactorSquared = normalizeFactor * normalizeFactor
+                normalizeSteer[gi] = helpNormalize / normalizeFactorSquared
+                result[gi] = scalarProd / normalizeFactorSquared * signalLossNormalization
+            elif steer_type == 3:
+                normalizeFactor = distGridToArrayCenter[gi] * helpNormalize
+                normalizeSteer[gi] = 1.0 / (distGridToArrayCenter[gi] * distGridToArrayCenter[gi]) / helpNormalize
+                result[gi] = scalarProd / (normalizeFactor * normalizeFactor) * signalLossNormalization
+            elif steer_type == 4:
+                normalizeFactor = nMics * helpNormalize
+                normalizeSteer[gi] = 1.0 / nMics
+                result[gi] = scalarProd / normalizeFactor * signalLossNormalization
 
 
 # fast implementation of eigenvalue beamformers
 @nb.njit(
     [
         (
-            nb.float64[::1],
-            nb.complex128[:, ::1],
-            nb.float64[::1],
-            nb.float64[:, ::1],
+            eigval_type[::1],
+            eigvec_type[:, ::1],
+            _dist_1d,
+            _dist_2d,
             nb.float64,
             nb.float64,
             nb.boolean,
             nb.int64,
             nb.float64[::1],
             nb.float64[::1],
-        ),
+        )
+        for eigval_type, eigvec_type in ((nb.float64, nb.complex128), (nb.float32, nb.complex64))
     ],
     cache=CACHED_OPTION,
     parallel=True,
@@ -344,204 +378,202 @@ def _freqBeamformer_EigValues(
     st2 = steer_type == 2
     st34 = steer_type == 3 or steer_type == 4
     helpNormalize = 0.0  # just a hint for the compiler
-    for gi in nb.prange(distGridToArrayCenter.shape[0]):
+    # the grid is split into chunks, so that the steering vector buffer is only allocated per chunk
+    nGridPoints = distGridToArrayCenter.shape[0]
+    chunkSize = max(1, -(-nGridPoints // NUM_GRID_CHUNKS))
+    for cntChunk in nb.prange(-(-nGridPoints // chunkSize)):
         steerVec = np.empty((nMics), np.complex128)
-        # building steering vector: in order to save some operation -> some normalization steps are
-        # applied after mat-vec-multipl.
-        for cntMics in range(nMics):
-            expArg = np.float32(waveNumber * distGridToAllMics[gi, cntMics])
-            steerVec[cntMics] = np.cos(expArg) - 1j * np.sin(expArg)
-        if st2:
-            helpNormalize = 0.0
-            for cntMics in range(nMics):
-                helpNormalize += distGridToAllMics[gi, cntMics] * distGridToAllMics[gi, cntMics]
-                # r_{t,i}-normalization is handled here
-                steerVec[cntMics] *= distGridToAllMics[gi, cntMics]
-        if st34:
-            helpNormalize = 0.0
+        for gi in range(cntChunk * chunkSize, min((cntChunk + 1) * chunkSize, nGridPoints)):
+            # building steering vector: in order to save some operation -> some normalization steps
+            # are applied after mat-vec-multipl.
             for cntMics in range(nMics):
-                helpNormalize += 1.0 / (distGridToAllMics[gi, cntMics] * distGridToAllMics[gi, cntMics])
-                # r_{t,i}-normalization is handled here
-                steerVec[cntMics] /= distGridToAllMics[gi, cntMics]
-
-        # eigenvalue beamforming
-        scalarProd = 0.0
-        if r_diag:
-            for cntEigVal in range(len(eigVal)):
-                scalarProdFullCSMperEigVal = 0.0 + 0.0j
-                scalarProdDiagCSMperEigVal = 0.0
+                expArg = np.float32(waveNumber * distGridToAllMics[gi, cntMics])
+                steerVec[cntMics] = np.cos(expArg) - 1j * np.sin(expArg)
+            if st2:
+                helpNormalize = 0.0
                 for cntMics in range(nMics):
-                    temp1 = eigVec[cntMics, cntEigVal].conjugate() * steerVec[cntMics]
-                    scalarProdFullCSMperEigVal += temp1
-                    scalarProdDiagCSMperEigVal += (temp1 * temp1.conjugate()).real
-                scalarProdFullCSMAbsSquared = (scalarProdFullCSMperEigVal * scalarProdFullCSMperEigVal.conjugate()).real
-                scalarProd += (scalarProdFullCSMAbsSquared - scalarProdDiagCSMperEigVal) * eigVal[cntEigVal]
-        else:
-            for cntEigVal in range(nEigs):
-                scalarProdFullCSMperEigVal = 0.0 + 0.0j
+                    helpNormalize += distGridToAllMics[gi, cntMics] * distGridToAllMics[gi, cntMics]
+                    # r_{t,i}-normalization is handled here
+                    steerVec[cntMics] *= distGridToAllMics[gi, cntMics]
+            if st34:
+                helpNormalize = 0.0
                 for cntMics in range(nMics):
-                    scalarProdFullCSMperEigVal += eigVec[cntMics, cntEigVal].conjugate() * steerVec[cntMics]
-                scalarProdFullCSMAbsSquared = (scalarProdFullCSMperEigVal * scalarProdFullCSMperEigVal.conjugate()).real
-                scalarProd += scalarProdFullCSMAbsSquared * eigVal[cntEigVal]
-
-        # specific normalzation for different steering vector formulations
+                    helpNormalize += 1.0 / (distGridToAllMics[gi, cntMics] * distGridToAllMics[gi, cntMics])
+                    # r_{t,i}-normalization is handled here
+                    steerVec[cntMics] /= distGridToAllMics[gi, cntMics]
+
+            # eigenvalue beamforming
+            scalarProd = 0.0
+            if r_diag:
+                for cntEigVal in range(len(eigVal)):
+                    scalarProdFullCSMperEigVal = 0.0 + 0.0j
+                    scalarProdDiagCSMperEigVal = 0.0
+                    for cntMics in range(nMics):
+                        temp1 = eigVec[cntMics, cntEigVal].conjugate() * steerVec[cntMics]
+                        scalarProdFullCSMperEigVal += temp1
+                        scalarProdDiagCSMperEigVal += (temp1 * temp1.conjugate()).real
+                    scalarProdFullCSMAbsSquared = (
+                        scalarProdFullCSMperEigVal * scalarProdFullCSMperEigVal.conjugate()
+                    ).real
+                    scalarProd += (scalarProdFullCSMAbsSquared - scalarProdDiagCSMperEigVal) * eigVal[cntEigVal]
+            else:
+                for cntEigVal in range(nEigs):
+                    scalarProdFullCSMperEigVal = 0.0 + 0.0j
+                    for cntMics in range(nMics):
+                        scalarProdFullCSMperEigVal += eigVec[cntMics, cntEigVal].conjugate() * steerVec[cntMics]
+                    scalarProdFullCSMAbsSquared = (
+                        scalarProdFullCSMperEigVal * scalarProdFullCSMperEigVal.conjugate()
+                    ).real
+                    scalarProd += scalarProdFullCSMAbsSquared * eigVal[cntEigVal]
+
+            # specific normalzation for different steering vector formulations
+            if steer_type == 1:
+                normalizeFactor = nMics
+                normalizeSteer[gi] = 1.0 / nMics
+                result[gi] = scalarProd / (normalizeFactor * normalizeFactor) * signalLossNormalization
+            elif steer_type == 2:
+                normalizeFactor = nMics * distGridToArrayCenter[gi]
+                normalizeFactorSquared = normalizeFactor * normalizeFactor
+                normalizeSteer[gi] = helpNormalize / normalizeFactorSquared
+                result[gi] = scalarProd / normalizeFactorSquared * signalLossNormalization
+            elif steer_type == 3:
+                normalizeFactor = distGridToArrayCenter[gi] * helpNormalize
+                normalizeSteer[gi] = 1.0 / (distGridToArrayCenter[gi] * distGridToArrayCenter[gi]) / helpNormalize
+                result[gi] = scalarProd / (normalizeFactor * normalizeFactor) * signalLossNormalization
+            elif steer_type == 4:
+                normalizeFactor = nMics * helpNormalize
+                normalizeSteer[gi] = 1.0 / nMics
+                result[gi] = scalarProd / normalizeFactor * signalLossNormalization
+
+
+def _csmHermitian(csm, r_diag):
+    # builds the full Hermitian csm from its upper-triangular-part (as in the other beamformers,
+    # the lower-triangular-part is not used), with the diagonal set to zero if r_diag
+    csm = np.asarray(csm, dtype=np.complex128)
+    csmHermitian = np.triu(csm, 1)
+    csmHermitian += csmHermitian.conj().T
+    if not r_diag:
+        csmHermitian[np.diag_indices(csm.shape[0])] = csm.diagonal().real
+    return csmHermitian
+
+
+def _freqBeamformer_SpecificSteerVec_Csm(csm, steerVec, signalLossNormalization, r_diag, result, normalizeSteer):
+    # evaluates 'steer^H * CSM * steer' for all gridpoints via matrix products (BLAS)
+    nMics = csm.shape[0]
+    csmHermitian = _csmHermitian(csm, r_diag)
+    steerVec = np.ascontiguousarray(steerVec, dtype=np.complex128)
+    # Real(a^H * b) is the dot product of the real views of a and b
+    steerReal = steerVec.view(np.float64)
+    # the gridpoints are evaluated in blocks, so that the temporary array is reused and stays small
+    nGridPoints = steerVec.shape[0]
+    matrixVecProd = np.empty((min(nGridPoints, GRID_BLOCK_SIZE), nMics), np.complex128)
+    for start in range(0, nGridPoints, GRID_BLOCK_SIZE):
+        block = slice(start, min(start + GRID_BLOCK_SIZE, nGridPoints))
+        # row gi holds 'CSM * steer' for gridpoint gi
+        blockProd = np.matmul(steerVec[block], csmHermitian.T, out=matrixVecProd[: block.stop - start])
+        np.einsum('ij,ij->i', blockProd.view(np.float64), steerReal[block], out=result[block])
+    result *= signalLossNormalization
+    np.einsum('ij,ij->i', steerReal, steerReal, out=normalizeSteer)
+
+
+def _freqBeamformer_Gpu(csm, inputTupleSteer, steer_type, signalLossNormalization, r_diag, result, normalizeSteer):
+    # evaluates 'steer^H * CSM * steer' on the GPU (CuPy) via matrix products in blocks of
+    # gridpoints. With steer_type 0, inputTupleSteer holds custom steering vectors, which are copied
+    # to the device block by block. Otherwise it holds the distances (which may already be device
+    # arrays) and the wave number, and the steering vectors of formulations I - IV are built on the
+    # device as in '_freqBeamformer_FullCSM', with the phase in single precision.
+    import cupy as cp
+
+    csmHermitianT = cp.asarray(_csmHermitian(csm, r_diag).T)
+    nMics = csmHermitianT.shape[0]
+    nGridPoints = result.shape[0]
+    if steer_type:
+        distGridToArrayCenter, distGridToAllMics, waveNumber = inputTupleSteer
+        distGridToArrayCenter = cp.asarray(distGridToArrayCenter)
+        distGridToAllMics = cp.asarray(distGridToAllMics)
+    else:
+        steerVec = inputTupleSteer
+    resultGpu = cp.empty(nGridPoints, cp.float64)
+    normalizeSteerGpu = cp.empty(nGridPoints, cp.float64)
+    for start in range(0, nGridPoints, GRID_BLOCK_SIZE):
+        block = slice(start, min(start + GRID_BLOCK_SIZE, nGridPoints))
+        if steer_type:
+            dist = distGridToAllMics[block]
+            expArg = (waveNumber * dist).astype(cp.float32)
+            steer = cp.empty(dist.shape, cp.complex128)
+            steer.real = cp.cos(expArg)
+            steer.imag = -cp.sin(expArg)
+            if steer_type == 2:
+                helpNormalize = (dist * dist).sum(axis=1)
+                steer *= dist
+            elif steer_type in (3, 4):
+                helpNormalize = (1.0 / (dist * dist)).sum(axis=1)
+                steer /= dist
+        else:
+            steer = cp.asarray(steerVec[block], dtype=cp.complex128)
+        # row gi holds 'CSM * steer' for gridpoint gi
+        scalarProd = (steer @ csmHermitianT * steer.conj()).real.sum(axis=1)
+        # specific normalization for different steering vector formulations
         if steer_type == 1:
-            normalizeFactor = nMics
-            normalizeSteer[gi] = 1.0 / nMics
-            result[gi] = scalarProd / (normalizeFactor * normalizeFactor) * signalLossNormalization
+            normalizeSteerGpu[block] = 1.0 / nMics
+            resultGpu[block] = scalarProd / (nMics * nMics)
         elif steer_type == 2:
-            normalizeFactor = nMics * distGridToArrayCenter[gi]
+            normalizeFactor = nMics * distGridToArrayCenter[block]
             normalizeFactorSquared = normalizeFactor * normalizeFactor
-            normalizeSteer[gi] = helpNormalize / normalizeFactorSquared
-            result[gi] = scalarProd / normalizeFactorSquared * signalLossNormalization
+            normalizeSteerGpu[block] = helpNormalize / normalizeFactorSquared
+            resultGpu[block] = scalarProd / normalizeFactorSquared
         elif steer_type == 3:
-            normalizeFactor = distGridToArrayCenter[gi] * helpNormalize
-            normalizeSteer[gi] = 1.0 / (distGridToArrayCenter[gi] * distGridToArrayCenter[gi]) / helpNormalize
-            result[gi] = scalarProd / (normalizeFactor * normalizeFactor) * signalLossNormalization
+            r0 = distGridToArrayCenter[block]
+            normalizeFactor = r0 * helpNormalize
+            normalizeSteerGpu[block] = 1.0 / (r0 * r0) / helpNormalize
+            resultGpu[block] = scalarProd / (normalizeFactor * normalizeFactor)
         elif steer_type == 4:
-            normalizeFactor = nMics * helpNormalize
-            normalizeSteer[gi] = 1.0 / nMics
-            result[gi] = scalarProd / normalizeFactor * signalLossNormalization
-
-
-@nb.guvectorize(
-    [(nb.complex128[:, :], nb.complex128[:], nb.float64[:], nb.float64[:], nb.float64[:])],
-    '(m,m),(m),()->(),()',
-    nopython=True,
-    target=PARALLEL_OPTION,
-    cache=CACHED_OPTION,
-    fastmath=FAST_OPTION,
-)
-def _freqBeamformer_SpecificSteerVec_FullCSM(csm, steerVec, signalLossNormalization, result, normalizeSteer):
-    # see bottom of information header of 'beamformerFreq' for information on which steps are taken,
-    # in order to gain speed improvements.
-    nMics = csm.shape[0]
-
-    # performing matrix-vector-multiplication (see bottom of information header of 'beamformerFreq')
-    scalarProd = 0.0
-    helpNormalize = 0.0
-    for cntMics in range(nMics):
-        helpNormalize += steerVec[cntMics] * steerVec[cntMics].conjugate()
-        leftVecMatrixProd = 0.0 + 0.0j
-        # calculate 'steer^H * CSM' of upper-triangular-part of csm (without diagonal)
-        for cntMics2 in range(cntMics):
-            leftVecMatrixProd += csm[cntMics2, cntMics] * steerVec[cntMics2].conjugate()
-        scalarProd += (
-            2 * (leftVecMatrixProd * steerVec[cntMics]).real
-        )  # use that csm is Hermitian (lower triangular of csm can be reduced to factor '2')
-        scalarProd += (
-            csm[cntMics, cntMics] * steerVec[cntMics].conjugate() * steerVec[cntMics]
-        ).real  # include diagonal of csm
-    normalizeSteer[0] = helpNormalize.real
-    result[0] = scalarProd * signalLossNormalization[0]
-
-
-@nb.guvectorize(
-    [(nb.complex128[:, :], nb.complex128[:], nb.float64[:], nb.float64[:], nb.float64[:])],
-    '(m,m),(m),()->(),()',
-    nopython=True,
-    target=PARALLEL_OPTION,
-    cache=CACHED_OPTION,
-    fastmath=FAST_OPTION,
-)
-def _freqBeamformer_SpecificSteerVec_CsmRemovedDiag(csm, steerVec, signalLossNormalization, result, normalizeSteer):
-    # see bottom of information header of 'beamformerFreq' for information on which steps are taken,
-    # in order to gain speed improvements.
-    nMics = csm.shape[0]
-
-    # performing matrix-vector-multiplication (see bottom of information header of 'beamformerFreq')
-    scalarProd = 0.0
-    helpNormalize = 0.0
-    for cntMics in range(nMics):
-        helpNormalize += steerVec[cntMics] * steerVec[cntMics].conjugate()
-        leftVecMatrixProd = 0.0 + 0.0j
-        # calculate 'steer^H * CSM' of upper-triangular-part of csm (without diagonal)
-        for cntMics2 in range(cntMics):
-            leftVecMatrixProd += csm[cntMics2, cntMics] * steerVec[cntMics2].conjugate()
-        scalarProd += (
-            2 * (leftVecMatrixProd * steerVec[cntMics]).real
-        )  # use that csm is Hermitian (lower triangular of csm can be reduced to factor '2')
-    normalizeSteer[0] = helpNormalize.real
-    result[0] = scalarProd * signalLossNormalization[0]
-
-
-@nb.guvectorize(
-    [(nb.float64[:], nb.complex128[:, :], nb.complex128[:], nb.float64[:], nb.float64[:], nb.float64[:])],
-    '(e),(m,e),(m),()->(),()',
-    nopython=True,
-    target=PARALLEL_OPTION,
-    cache=CACHED_OPTION,
-    fastmath=FAST_OPTION,
-)
-def _freqBeamformer_EigValProb_SpecificSteerVec_FullCSM(
-    eigVal,
-    eigVec,
-    steerVec,
-    signalLossNormalization,
-    result,
-    normalizeSteer,
-):
-    # see bottom of information header of 'beamformerFreq' for information on which steps are taken,
-    # in order to gain speed improvements.
-    nMics = eigVec.shape[0]
-
-    # get h^H * h for normalization
-    helpNormalize = 0.0
-    for cntMics in range(nMics):
-        helpNormalize += steerVec[cntMics] * steerVec[cntMics].conjugate()
-
-    # performing matrix-vector-multiplication via spectral decomp. (see bottom of information header
-    # of 'beamformerFreq')
-    scalarProdFullCSM = 0.0
-    for cntEigVal in range(len(eigVal)):
-        scalarProdFullCSMperEigVal = 0.0 + 0.0j
-        for cntMics in range(nMics):
-            scalarProdFullCSMperEigVal += eigVec[cntMics, cntEigVal].conjugate() * steerVec[cntMics]
-        scalarProdFullCSMAbsSquared = (scalarProdFullCSMperEigVal * scalarProdFullCSMperEigVal.conjugate()).real
-        scalarProdFullCSM += scalarProdFullCSMAbsSquared * eigVal[cntEigVal]
-    normalizeSteer[0] = helpNormalize.real
-    result[0] = scalarProdFullCSM * signalLossNormalization[0]
+            normalizeSteerGpu[block] = 1.0 / nMics
+            resultGpu[block] = scalarProd / (nMics * helpNormalize)
+        else:
+            normalizeSteerGpu[block] = (steer.real**2 + steer.imag**2).sum(axis=1)
+            resultGpu[block] = scalarProd
+    result[:] = cp.asnumpy(resultGpu)
+    result *= signalLossNormalization
+    normalizeSteer[:] = cp.asnumpy(normalizeSteerGpu)
 
 
-@nb.guvectorize(
-    [(nb.float64[:], nb.complex128[:, :], nb.complex128[:], nb.float64[:], nb.float64[:], nb.float64[:])],
-    '(e),(m,e),(m),()->(),()',
-    nopython=True,
-    target=PARALLEL_OPTION,
-    cache=CACHED_OPTION,
-    fastmath=FAST_OPTION,
-)
-def _freqBeamformer_EigValProb_SpecificSteerVec_CsmRemovedDiag(
+def _freqBeamformer_EigValProb_SpecificSteerVec(
     eigVal,
     eigVec,
     steerVec,
     signalLossNormalization,
+    r_diag,
     result,
     normalizeSteer,
 ):
-    # see bottom of information header of 'beamformerFreq' for information on which steps are taken,
-    # in order to gain speed improvements.
-    nMics = eigVec.shape[0]
-
-    # get h^H * h for normalization
-    helpNormalize = 0.0
-    for cntMics in range(nMics):
-        helpNormalize += steerVec[cntMics] * steerVec[cntMics].conjugate()
-
-    # performing matrix-vector-multiplication via spectral decomp. (see bottom of information header
-    # of 'beamformerFreq')
-    scalarProdReducedCSM = 0.0
-    for cntEigVal in range(len(eigVal)):
-        scalarProdFullCSMperEigVal = 0.0 + 0.0j
-        scalarProdDiagCSMperEigVal = 0.0
-        for cntMics in range(nMics):
-            temp1 = eigVec[cntMics, cntEigVal].conjugate() * steerVec[cntMics]
-            scalarProdFullCSMperEigVal += temp1
-            scalarProdDiagCSMperEigVal += (temp1 * temp1.conjugate()).real
-        scalarProdFullCSMAbsSquared = (scalarProdFullCSMperEigVal * scalarProdFullCSMperEigVal.conjugate()).real
-        scalarProdReducedCSM += (scalarProdFullCSMAbsSquared - scalarProdDiagCSMperEigVal) * eigVal[cntEigVal]
-    normalizeSteer[0] = helpNormalize.real
-    result[0] = scalarProdReducedCSM * signalLossNormalization[0]
+    # evaluates 'sum_k eigVal_k * |eigVec_k^H * steer|^2' for all gridpoints, the projections of the
+    # steering vectors onto the eigenvectors are matrix products, which are done by BLAS.
+    nMics, nEigs = eigVec.shape
+    eigVal = np.asarray(eigVal, dtype=np.float64)
+    eigVecConj = np.conj(eigVec, dtype=np.complex128)
+    steerVec = np.ascontiguousarray(steerVec, dtype=np.complex128)
+    steerReal = steerVec.view(np.float64)
+    # the gridpoints are evaluated in blocks, so that the temporary arrays are reused and stay small
+    nGridPoints = steerVec.shape[0]
+    nBlock = min(nGridPoints, GRID_BLOCK_SIZE)
+    scalarProdPerEigVal = np.empty((nBlock, nEigs), np.complex128)
+    scalarProdAbsSquared = np.empty((nBlock, nEigs), np.float64)
+    for start in range(0, nGridPoints, GRID_BLOCK_SIZE):
+        block = slice(start, min(start + GRID_BLOCK_SIZE, nGridPoints))
+        num = block.stop - start
+        # row gi holds 'eigVec^H * steer' for gridpoint gi
+        blockProd = np.matmul(steerVec[block], eigVecConj, out=scalarProdPerEigVal[:num])
+        blockProdReal = blockProd.view(np.float64).reshape(num, nEigs, 2)
+        np.einsum('ijk,ijk->ij', blockProdReal, blockProdReal, out=scalarProdAbsSquared[:num])
+        np.dot(scalarProdAbsSquared[:num], eigVal, out=result[block])
+    if r_diag:
+        # the diagonal of the csm is 'sum_k eigVal_k * |eigVec_k|^2'
+        csmDiag = (eigVecConj.real**2 + eigVecConj.imag**2) @ eigVal
+        steerParts = steerReal.reshape(nGridPoints, nMics, 2)
+        result -= np.einsum('ijk,ijk,j->i', steerParts, steerParts, csmDiag)
+    result *= signalLossNormalization
+    np.einsum('ij,ij->i', steerReal, steerReal, out=normalizeSteer)
 
 
 # %% Point - Spread - Function
@@ -42,7 +42,9 @@ Implements beamformers in the frequency domain.
 # imports from other packages
 
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from warnings import warn
+from weakref import WeakValueDictionary
 
 import numpy as np
 import scipy.linalg as spla
@@ -66,6 +68,7 @@ from traits.api import (
     Property,
     Range,
     Tuple,
+    Union,
     cached_property,
     observe,
     property_depends_on,
@@ -78,10 +81,10 @@ from .environments import Environment
 from .fastFuncs import beamformerFreq, calcPointSpreadFunction, calcTransfer, damasSolverGaussSeidel
 from .grids import Grid, Sector
 from .h5cache import H5cache
-from .h5files import H5CacheFileBase
+from .h5files import H5CacheFileBase, _get_row_chunkshape
 from .internal import digest
 from .microphones import MicGeom
-from .spectra import PowerSpectra
+from .spectra import PowerSpectra, _get_num_threads
 from .tfastfuncs import _steer_I, _steer_II, _steer_III, _steer_IV
 
 sklearn_ndict = {}
@@ -90,6 +93,16 @@ if parse(sklearn.__version__) < parse('1.4'):
 
 BEAMFORMER_BASE_DIGEST_DEPENDENCIES = ['freq_data.digest', 'r_diag', 'r_diag_norm', 'precision', 'steer.digest']
 
+# grid to microphone distances, shared by all steering vectors with the same grid, microphone
+# geometry and environment; entries are dropped as soon as no steering vector holds them anymore
+_rm_cache = WeakValueDictionary()
+
+
+def _squared_norm(x):
+    """Squared norm of the rows of a complex array, evaluated on real and imaginary parts."""
+    # avoids the complex conjugate copy and the complex products of einsum(x, x.conj())
+    return np.einsum('ij,ij->i', x.real, x.real) + np.einsum('ij,ij->i', x.imag, x.imag)
+
 
 class SteeringVector(HasStrictTraits):
     """
@@ -117,7 +130,8 @@ class SteeringVector(HasStrictTraits):
     r0 = Property(desc='array center to grid distances')
 
     # Sound travel distances from array microphones to grid
-    # points (readonly). Feature may change.
+    # points (readonly, shared between steering vectors with equal
+    # grid, mics and env). Feature may change.
     rm = Property(desc='all array mics to grid distances')
 
     # mirror trait for ref
@@ -132,10 +146,10 @@ class SteeringVector(HasStrictTraits):
 
     _steer_funcs_freq = Dict(
         {
-            'classic': lambda x: x / np.abs(x) / x.shape[-1],
-            'inverse': lambda x: 1.0 / x.conj() / x.shape[-1],
-            'true level': lambda x: x / np.einsum('ij,ij->i', x, x.conj())[:, np.newaxis],
-            'true location': lambda x: x / np.sqrt(np.einsum('ij,ij->i', x, x.conj()) * x.shape[-1])[:, np.newaxis],
+            'classic': lambda x: x / (np.abs(x) * x.shape[-1]),
+            'inverse': lambda x: x / ((x.real**2 + x.imag**2) * x.shape[-1]),
+            'true level': lambda x: x / _squared_norm(x)[:, np.newaxis],
+            'true location': lambda x: x / np.sqrt(_squared_norm(x) * x.shape[-1])[:, np.newaxis],
         },
         transient=True,
         desc='dictionary of frequency domain steering vector functions',
@@ -182,7 +196,13 @@ class SteeringVector(HasStrictTraits):
 
     @property_depends_on(['grid.digest', 'mics.digest', 'env.digest'])
     def _get_rm(self):
-        return np.atleast_2d(self.env._r(self.grid.pos, self.mics.pos))
+        key = (self.grid.digest, self.mics.digest, self.env.digest)
+        rm = _rm_cache.get(key)
+        if rm is None:
+            rm = np.atleast_2d(self.env._r(self.grid.pos, self.mics.pos))
+            rm.flags.writeable = False  # shared between steering vectors, see _rm_cache
+            _rm_cache[key] = rm
+        return rm
 
     @cached_property
     def _get_digest(self):
@@ -306,6 +326,27 @@ class BeamformerBase(HasStrictTraits):
     #: Boolean flag, if 'True' (default), the result is cached in h5 files.
     cached = Bool(True, desc='cached flag')
 
+    #: The number of workers (threads) to use for evaluating the beamformer at several
+    #: frequencies concurrently. This only applies to steering vectors derived from
+    #: :class:`SteeringVector`, which are evaluated with matrix products. If set to a negative
+    #: value, all available logical CPUs are used. Default is ``None``, which uses one thread.
+    workers = Union(Int(), None, default_value=None, desc='number of workers to use')
+
+    #: Boolean flag, if 'True', the beamformer is evaluated on the GPU, which needs the CuPy
+    #: package. For :class:`SteeringVector`, the steering vectors of the chosen
+    #: :attr:`~SteeringVector.steer_type` are built on the GPU from the distances, otherwise the
+    #: custom steering vectors are copied to the GPU, in both cases in blocks of grid points. This
+    #: is supported by :class:`BeamformerBase`, :class:`BeamformerCapon`, :class:`BeamformerEig`,
+    #: :class:`BeamformerMusic` and for the delay-and-sum map of :class:`BeamformerDamas` and
+    #: :class:`BeamformerDamasPlus`; the other beamformers only accept 'False'. Defaults to 'False'.
+    use_gpu = Property(desc='evaluate on GPU')
+
+    _use_gpu = Bool(False)
+
+    # 'True' if use_gpu is honoured, subclasses that evaluate the steering vectors in their own
+    # way set this to 'False' and only accept use_gpu=False
+    _supports_gpu = True
+
     # hdf5 cache file
     h5f = Instance(H5CacheFileBase, transient=True)
 
@@ -328,6 +369,17 @@ class BeamformerBase(HasStrictTraits):
     def _get_digest(self):
         return digest(self)
 
+    def _get_use_gpu(self):
+        return self._use_gpu
+
+    def _set_use_gpu(self, use_gpu):
+        if use_gpu and not self._supports_gpu:
+            raise TraitError(args=self, name='use_gpu', info="'False' (no GPU support)", value=use_gpu)
+        if use_gpu and not config.have_cupy:
+            msg = f'Cannot import CuPy package. No CuPy installed. {self.__class__.__name__} not available on GPU.'
+            raise ImportError(msg)
+        self._use_gpu = use_gpu
+
     def _get_filecache(self):
         """
         Function collects cached results from file depending on global/local caching behaviour.
@@ -360,16 +412,14 @@ class BeamformerBase(HasStrictTraits):
             )
             if isinstance(self, BeamformerAdaptiveGrid):
                 self.h5f.create_compressible_array('gpos', (3, self.size), 'float64', group)
-                self.h5f.create_compressible_array('result', (numfreq, self.size), self.precision, group)
+                shape = (numfreq, self.size)
             elif isinstance(self, BeamformerSODIX):
-                self.h5f.create_compressible_array(
-                    'result',
-                    (numfreq, self.steer.grid.size * self.steer.mics.num_mics),
-                    self.precision,
-                    group,
-                )
+                shape = (numfreq, self.steer.grid.size * self.steer.mics.num_mics)
             else:
-                self.h5f.create_compressible_array('result', (numfreq, self.steer.grid.size), self.precision, group)
+                shape = (numfreq, self.steer.grid.size)
+            # results are calculated and read per frequency, so chunks hold complete frequencies
+            chunkshape = _get_row_chunkshape(shape, self.precision)
+            self.h5f.create_compressible_array('result', shape, self.precision, group, chunkshape)
 
         ac = self.h5f.get_data_by_reference('result', '/' + nodename)
         fr = self.h5f.get_data_by_reference('freqs', '/' + nodename)
@@ -435,12 +485,23 @@ class BeamformerBase(HasStrictTraits):
             normfactor = self.r_diag_norm
         return normfactor
 
-    def _beamformer_params(self):
+    def _csm_dtype(self):
+        # the CSM and its eigenvectors are passed to the core beamformer functions in single
+        # precision if the spectra are computed in single precision, and in double precision else
+        return np.dtype('complex64' if self.freq_data.precision == 'complex64' else 'complex128')
+
+    def _beamformer_params(self, use_gpu=False):
         """
         Manages the parameters for calling of the core beamformer functionality.
 
         This is a workaround to allow faster calculation and may change in the future.
 
+        Parameters
+        ----------
+        use_gpu : bool, optional
+            If 'True', the distances of a :class:`SteeringVector` are copied to the GPU once, so
+            that they are not transferred again for each frequency. Defaults to 'False'.
+
         Returns
         -------
             - String containing the steering vector type
@@ -448,14 +509,64 @@ class BeamformerBase(HasStrictTraits):
         """
         if type(self.steer) is SteeringVector:  # for simple steering vector, use faster method
             param_type = self.steer.steer_type
+            r0, rm = self.steer.r0, self.steer.rm
+            if use_gpu:
+                import cupy as cp
+
+                r0, rm = cp.asarray(r0), cp.asarray(rm)
 
             def param_steer_func(f):
-                return (self.steer.r0, self.steer.rm, 2 * np.pi * f / self.steer.env.c)
+                return (r0, rm, 2 * np.pi * f / self.steer.env.c)
         else:
             param_type = 'custom'
             param_steer_func = self.steer.steer_vector
         return param_type, param_steer_func
 
+    def _beamformer_freq(self, ind, csm_func, normfactor):
+        """
+        Evaluates the core beamformer functionality for several frequencies.
+
+        With custom steering vectors, the evaluation is done with matrix products that release
+        the GIL and is run for several frequencies in parallel threads, according to
+        :attr:`workers`. The predefined steering vectors use parallel Numba functions and are
+        evaluated one frequency after the other, as is the evaluation on the GPU
+        (:attr:`use_gpu`), which keeps the requested steering vector type.
+
+        Parameters
+        ----------
+        ind : array of int
+            Frequency indices to evaluate.
+        csm_func : callable
+            Function that returns the CSM (or a tuple of eigenvalues and eigenvectors) for
+            a frequency index.
+        normfactor : float
+            Normalization factor passed to :func:`~acoular.fastFuncs.beamformerFreq`.
+
+        Yields
+        ------
+        tuple
+            Frequency index and beamformer output for this frequency.
+        """
+        f = self._f
+        use_gpu = self.use_gpu
+        param_steer_type, steer_vector = self._beamformer_params(use_gpu)
+
+        def calc(args):
+            return beamformerFreq(param_steer_type, self.r_diag, normfactor, *args, useGpu=use_gpu)[0]
+
+        num_threads = _get_num_threads(self.workers) if param_steer_type == 'custom' and not use_gpu else 1
+        if num_threads == 1:
+            for i in ind:
+                yield i, calc((steer_vector(f[i]), csm_func(i)))
+            return
+        # inputs are prepared and results are stored in this thread, as reading from and writing
+        # to cache files is not thread safe
+        with ThreadPoolExecutor(num_threads) as executor:
+            for start in range(0, len(ind), num_threads):
+                chunk = ind[start : start + num_threads]
+                args = [(steer_vector(f[i]), csm_func(i)) for i in chunk]
+                yield from zip(chunk, executor.map(calc, args))
+
     def _calc(self, ind):
         """
         Calculates the result for the frequencies defined by :attr:`freq_data`.
@@ -474,25 +585,38 @@ class BeamformerBase(HasStrictTraits):
         -------
         This method only returns values through :attr:`_ac` and :attr:`_fr`
         """
-        f = self._f
-        normfactor = self.sig_loss_norm()
-        param_steer_type, steer_vector = self._beamformer_params()
-        for i in ind:
-            # print(f'compute{i}')
-            csm = np.array(self.freq_data.csm[i], dtype='complex128')
-            beamformerOutput = beamformerFreq(
-                param_steer_type,
-                self.r_diag,
-                normfactor,
-                steer_vector(f[i]),
-                csm,
-            )[0]
-            if self.r_diag:  # set (unphysical) negative output values to 0
-                indNegSign = np.sign(beamformerOutput) < 0
-                beamformerOutput[indNegSign] = 0.0
+        for i, beamformerOutput in self._delay_and_sum(ind):
             self._ac[i] = beamformerOutput
             self._fr[i] = 1
 
+    def _delay_and_sum(self, ind):
+        """
+        Evaluates the delay-and-sum beamformer for several frequencies.
+
+        This is the result of :class:`BeamformerBase`, which is also used as the dirty map by the
+        deconvolution beamformers.
+
+        Parameters
+        ----------
+        ind : array of int
+            Frequency indices to evaluate.
+
+        Yields
+        ------
+        tuple
+            Frequency index and delay-and-sum map for this frequency.
+        """
+        normfactor = self.sig_loss_norm()
+        csm_dtype = self._csm_dtype()
+
+        def csm_func(i):
+            return np.array(self.freq_data.csm[i], dtype=csm_dtype)
+
+        for i, beamformerOutput in self._beamformer_freq(ind, csm_func, normfactor):
+            if self.r_diag:  # set (unphysical) negative output values to 0
+                np.maximum(beamformerOutput, 0.0, out=beamformerOutput)
+            yield i, beamformerOutput
+
     def synthetic(self, f, num=0):
         """
         Evaluates the beamforming result for an arbitrary frequency band.
@@ -635,7 +759,8 @@ class BeamformerBase(HasStrictTraits):
                 msg,
             )
         gshape = self.steer.grid.shape
-        num_freqs = self.freq_data.fftfreq().shape[0]
+        freq = self.freq_data.fftfreq()
+        num_freqs = freq.shape[0]
         if num == 0 or frange is None:
             if frange is None:
                 ind_low = self.freq_data.ind_low
@@ -647,7 +772,7 @@ class BeamformerBase(HasStrictTraits):
                 irange = (ind_low, ind_high)
                 num = 0
             elif len(frange) == 2:
-                irange = (np.searchsorted(self._f, frange[0]), np.searchsorted(self._f, frange[1]))
+                irange = (np.searchsorted(freq, frange[0]), np.searchsorted(freq, frange[1]))
             else:
                 msg = 'Only a tuple of length 2 is allowed for frange if num==0'
                 raise TypeError(
@@ -661,7 +786,7 @@ class BeamformerBase(HasStrictTraits):
                 h[i] = r[i - sl.start].reshape(gshape)[ind].sum()
             if frange is None:
                 return h
-            return self._f[sl], h[sl]
+            return freq[sl], h[sl]
 
         h = np.zeros(len(frange), dtype=float)
         for i, f in enumerate(frange):
@@ -676,6 +801,8 @@ class BeamformerFunctional(BeamformerBase):
     See :cite:`Dougherty2014` for details.
     """
 
+    _supports_gpu = False
+
     #: Functional exponent, defaults to 1 (= Classic Beamforming).
     gamma = Float(1, desc='functional exponent')
 
@@ -742,8 +869,7 @@ class BeamformerFunctional(BeamformerBase):
                 beamformerOutput /= steerNorm  # take normalized steering vec
 
                 # set (unphysical) negative output values to 0
-                indNegSign = np.sign(beamformerOutput) < 0
-                beamformerOutput[indNegSign] = 0.0
+                np.maximum(beamformerOutput, 0.0, out=beamformerOutput)
             else:
                 eva = np.array(self.freq_data.eva[i], dtype='float64') ** (1.0 / self.gamma)
                 eve = np.array(self.freq_data.eve[i], dtype='complex128')
@@ -797,13 +923,35 @@ class BeamformerCapon(BeamformerBase):
         -------
         This method only returns values through :attr:`_ac` and :attr:`_fr`
         """
-        f = self._f
         nMics = self.freq_data.num_channels
         normfactor = self.sig_loss_norm() * nMics**2
-        param_steer_type, steer_vector = self._beamformer_params()
-        for i in ind:
-            csm = np.array(spla.inv(np.array(self.freq_data.csm[i], dtype='complex128')), order='C')
-            beamformerOutput = beamformerFreq(param_steer_type, self.r_diag, normfactor, steer_vector(f[i]), csm)[0]
+        # the CSM is inverted via its Cholesky decomposition, which only yields the upper triangle
+        # of the inverse, the lower triangle is then filled by mirroring the upper one. A CSM that
+        # is not positive definite is inverted via LU decomposition instead. The LAPACK routines
+        # and the optimal workspace size are looked up only once for all frequencies
+        potrf, potri, getrf, getri, getri_lwork = spla.get_lapack_funcs(
+            ('potrf', 'potri', 'getrf', 'getri', 'getri_lwork'), dtype=np.complex128
+        )
+        lwork = int(np.real(getri_lwork(nMics)[0]))
+
+        def csm_func(i):
+            csm = np.array(self.freq_data.csm[i], dtype='complex128', order='F')
+            chol, info = potrf(csm, lower=0, clean=0)
+            if info == 0:
+                csm_inv, info = potri(chol, lower=0, overwrite_c=1)
+                if info == 0:
+                    csm_inv = np.triu(csm_inv)
+                    csm_inv += np.triu(csm_inv, 1).conj().T
+                    return csm_inv
+            lu, piv, info = getrf(csm, overwrite_a=1)
+            if info == 0:
+                csm_inv, info = getri(lu, piv, lwork=lwork, overwrite_lu=1)
+            if info > 0:
+                msg = f'Cross spectral matrix at frequency index {i} is singular.'
+                raise np.linalg.LinAlgError(msg)
+            return np.ascontiguousarray(csm_inv)
+
+        for i, beamformerOutput in self._beamformer_freq(ind, csm_func, normfactor):
             self._ac[i] = 1.0 / beamformerOutput
             self._fr[i] = 1
 
@@ -856,23 +1004,19 @@ class BeamformerEig(BeamformerBase):
         -------
         This method only returns values through :attr:`_ac` and :attr:`_fr`
         """
-        f = self._f
         na = int(self.na)  # eigenvalue taken into account
         normfactor = self.sig_loss_norm()
-        param_steer_type, steer_vector = self._beamformer_params()
-        for i in ind:
-            eva = np.array(self.freq_data.eva[i], dtype='float64')
-            eve = np.array(self.freq_data.eve[i], dtype='complex128')
-            beamformerOutput = beamformerFreq(
-                param_steer_type,
-                self.r_diag,
-                normfactor,
-                steer_vector(f[i]),
-                (eva[na : na + 1], eve[:, na : na + 1]),
-            )[0]
+        eve_dtype = self._csm_dtype()
+        eva_dtype = np.finfo(eve_dtype).dtype
+
+        def csm_func(i):
+            eva = np.array(self.freq_data.eva[i], dtype=eva_dtype)
+            eve = np.array(self.freq_data.eve[i], dtype=eve_dtype)
+            return (eva[na : na + 1], eve[:, na : na + 1])
+
+        for i, beamformerOutput in self._beamformer_freq(ind, csm_func, normfactor):
             if self.r_diag:  # set (unphysical) negative output values to 0
-                indNegSign = np.sign(beamformerOutput) < 0
-                beamformerOutput[indNegSign] = 0
+                np.maximum(beamformerOutput, 0.0, out=beamformerOutput)
             self._ac[i] = beamformerOutput
             self._fr[i] = 1
 
@@ -917,21 +1061,18 @@ class BeamformerMusic(BeamformerEig):
         -------
         This method only returns values through :attr:`_ac` and :attr:`_fr`
         """
-        f = self._f
         nMics = self.freq_data.num_channels
         n = int(self.steer.mics.num_mics - self.na)
         normfactor = self.sig_loss_norm() * nMics**2
-        param_steer_type, steer_vector = self._beamformer_params()
-        for i in ind:
-            eva = np.array(self.freq_data.eva[i], dtype='float64')
-            eve = np.array(self.freq_data.eve[i], dtype='complex128')
-            beamformerOutput = beamformerFreq(
-                param_steer_type,
-                self.r_diag,
-                normfactor,
-                steer_vector(f[i]),
-                (eva[:n], eve[:, :n]),
-            )[0]
+        eve_dtype = self._csm_dtype()
+        eva_dtype = np.finfo(eve_dtype).dtype
+
+        def csm_func(i):
+            eva = np.array(self.freq_data.eva[i], dtype=eva_dtype)
+            eve = np.array(self.freq_data.eve[i], dtype=eve_dtype)
+            return (eva[:n], eve[:, :n])
+
+        for i, beamformerOutput in self._beamformer_freq(ind, csm_func, normfactor):
             self._ac[i] = 4e-10 * beamformerOutput.min() / beamformerOutput
             self._fr[i] = 1
 
@@ -1169,21 +1310,8 @@ class BeamformerDamas(BeamformerBase):
         This method only returns values through :attr:`_ac` and :attr:`_fr`
         """
         f = self._f
-        normfactor = self.sig_loss_norm()
         p = PointSpreadFunction(steer=self.steer, calcmode=self.calcmode, precision=self.psf_precision)
-        param_steer_type, steer_vector = self._beamformer_params()
-        for i in ind:
-            csm = np.array(self.freq_data.csm[i], dtype='complex128')
-            y = beamformerFreq(
-                param_steer_type,
-                self.r_diag,
-                normfactor,
-                steer_vector(f[i]),
-                csm,
-            )[0]
-            if self.r_diag:  # set (unphysical) negative output values to 0
-                indNegSign = np.sign(y) < 0
-                y[indNegSign] = 0.0
+        for i, y in self._delay_and_sum(ind):
             x = y.copy()
             p.freq = f[i]
             psf = p.psf[:]
@@ -1254,20 +1382,7 @@ class BeamformerDamasPlus(BeamformerDamas):
         f = self._f
         p = PointSpreadFunction(steer=self.steer, calcmode=self.calcmode, precision=self.psf_precision)
         unit = self.unit_mult
-        normfactor = self.sig_loss_norm()
-        param_steer_type, steer_vector = self._beamformer_params()
-        for i in ind:
-            csm = np.array(self.freq_data.csm[i], dtype='complex128')
-            y = beamformerFreq(
-                param_steer_type,
-                self.r_diag,
-                normfactor,
-                steer_vector(f[i]),
-                csm,
-            )[0]
-            if self.r_diag:  # set (unphysical) negative output values to 0
-                indNegSign = np.sign(y) < 0
-                y[indNegSign] = 0.0
+        for i, y in self._delay_and_sum(ind):
             y *= unit
             p.freq = f[i]
             psf = p.psf[:]
@@ -1317,6 +1432,8 @@ class BeamformerOrth(BeamformerBase):
     New faster implementation without explicit (:class:`BeamformerEig`).
     """
 
+    _supports_gpu = False
+
     #: List of components to consider, use this to directly set the eigenvalues
     #: used in the beamformer. Alternatively, set :attr:`n`.
     eva_list = CArray(dtype=int, value=np.array([-1]), desc='components')
@@ -1366,12 +1483,14 @@ class BeamformerOrth(BeamformerBase):
         for i in ind:
             eva = np.array(self.freq_data.eva[i], dtype='float64')
             eve = np.array(self.freq_data.eve[i], dtype='complex128')
+            # the steering vectors are the same for all eigenvalues at this frequency
+            steer_i = steer_vector(f[i])
             for n in self.eva_list:
                 beamformerOutput = beamformerFreq(
                     param_steer_type,
                     self.r_diag,
                     normfactor,
-                    steer_vector(f[i]),
+                    steer_i,
                     (np.ones(1), eve[:, n].reshape((-1, 1))),
                 )[0]
                 self._ac[i, beamformerOutput.argmax()] += eva[n] / num_channels
@@ -1386,6 +1505,8 @@ class BeamformerCleansc(BeamformerBase):
     Classic delay-and-sum beamforming is already included.
     """
 
+    _supports_gpu = False
+
     #: no of CLEAN-SC iterations
     #: defaults to 0, i.e. automatic (max 2*num_channels)
     n_iter = Int(0, desc='no of iterations')
@@ -1434,8 +1555,10 @@ class BeamformerCleansc(BeamformerBase):
         param_steer_type, steer_vector = self._beamformer_params()
         for i in ind:
             csm = np.array(self.freq_data.csm[i], dtype='complex128', copy=True)
+            # the steering vectors are the same for all iterations at this frequency
+            steer_i = steer_vector(f[i])
             # h = self.steer._beamformerCall(f[i], self.r_diag, normfactor, (csm,))[0]
-            h = beamformerFreq(param_steer_type, self.r_diag, normfactor, steer_vector(f[i]), csm)[0]
+            h = beamformerFreq(param_steer_type, self.r_diag, normfactor, steer_i, csm)[0]
             # CLEANSC Iteration
             result *= 0.0
             for j in range(J):
@@ -1447,7 +1570,8 @@ class BeamformerCleansc(BeamformerBase):
                 wmax = self.steer.steer_vector(f[i], xi_max) * np.sqrt(normfactor)
                 wmax = wmax[0].conj()  # as old code worked with conjugated csm..should be updated
                 hh = wmax.copy()
-                D1 = np.dot(csm.T - np.diag(np.diag(csm)), wmax) / hmax
+                # product with the csm without its diagonal, which is removed from the result
+                D1 = (np.dot(csm.T, wmax) - csm.diagonal() * wmax) / hmax
                 ww = wmax.conj() * wmax
                 for _ in range(20):
                     H = hh.conj() * hh
@@ -1461,7 +1585,7 @@ class BeamformerCleansc(BeamformerBase):
                     param_steer_type,
                     self.r_diag,
                     normfactor,
-                    steer_vector(f[i]),
+                    steer_i,
                     (np.array((hmax,)), hh.conj()),
                 )[0]
                 h -= self.damp * h1
@@ -1477,6 +1601,8 @@ class BeamformerClean(BeamformerBase):
     See :cite:`Hoegbom1974` for details.
     """
 
+    _supports_gpu = False
+
     #: The floating-number-precision of the PSFs. Default is 64 bit.
     psf_precision = Enum('float64', 'float32', desc='precision of PSF.')
 
@@ -1539,8 +1665,7 @@ class BeamformerClean(BeamformerBase):
                 csm,
             )[0]
             if self.r_diag:  # set (unphysical) negative output values to 0
-                indNegSign = np.sign(dirty) < 0
-                dirty[indNegSign] = 0.0
+                np.maximum(dirty, 0.0, out=dirty)
 
             clean = np.zeros(gs, dtype=dirty.dtype)
             i_iter = 0
@@ -1568,6 +1693,8 @@ class BeamformerCMF(BeamformerBase):
     See :cite:`Yardibi2008` for details.
     """
 
+    _supports_gpu = False
+
     #: Type of fit method to be used ('LassoLars', 'LassoLarsBIC',
     #: 'OMPCV' or 'NNLS', defaults to 'LassoLars').
     #: These methods are implemented in
@@ -1794,6 +1921,8 @@ class BeamformerSODIX(BeamformerBase):
     See :cite:`Funke2017` and :cite:`Oertwig2019` for details.
     """
 
+    _supports_gpu = False
+
     #: Type of fit method to be used ('fmin_l_bfgs_b').
     #: These methods are implemented in
     #: the scipy module.
@@ -1956,6 +2085,8 @@ class BeamformerGIB(BeamformerEig):  # BeamformerEig #BeamformerBase
     See :cite:`Suzuki2011` for details.
     """
 
+    _supports_gpu = False
+
     #: Unit multiplier for evaluating, e.g., nPa instead of Pa.
     #: Values are converted back before returning.
     #: Temporary conversion may be necessary to not reach machine epsilon
@@ -2195,6 +2326,8 @@ class BeamformerGIB(BeamformerEig):  # BeamformerEig #BeamformerBase
 class BeamformerAdaptiveGrid(BeamformerBase, Grid):
     """Abstract base class for array methods without predefined grid."""
 
+    _supports_gpu = False
+
     # the grid positions live in a shadow trait
     _gpos = Any
 
@@ -2384,7 +2517,14 @@ def L_p(x):  # noqa: N802
         If `x<0`, -350.0 dB is returned.
     """
     # new version to prevent division by zero warning for float32 arguments
-    return 10 * np.log10(np.clip(x / 4e-10, 1e-35, None))
+    res = np.divide(x, 4e-10)
+    if np.ndim(res) == 0:
+        return 10 * np.log10(np.maximum(res, 1e-35))
+    # work in place on the single temporary array, float32 input stays float32
+    np.maximum(res, 1e-35, out=res)
+    np.log10(res, out=res)
+    res *= 10
+    return res
 
 
 #    return where(x>0, 10*np.log10(x/4e-10), -1000.)
@@ -48,11 +48,6 @@ class RFFT(BaseSpectra, SpectraOut):
     #: This provides the input time-domain data for FFT processing.
     source = Instance(SamplesGenerator)
 
-    #: The number of workers to use for FFT calculation.
-    #: If set to a negative value, all available logical CPUs are used.
-    #: Default is ``None``, which relies on the :func:`scipy.fft.rfft` implementation.
-    workers = Union(Int(), None, default_value=None, desc='number of workers to use')
-
     #: Defines the scaling method for the FFT result. Options are:
     #:
     #:     - ``'none'``: No scaling is applied.
@@ -152,9 +147,9 @@ class RFFT(BaseSpectra, SpectraOut):
         - If the input data source provides fewer samples than required for a complete block,
           the remaining spectra are padded or adjusted accordingly.
         """
-        wind = self.window_(self.block_size)
+        wind, weight = self._window_data
         if self.scaling == 'none' or self.scaling == 'energy':  # only compensate for the window
-            svalue = 1 / np.sqrt(np.dot(wind, wind) / self.block_size)
+            svalue = 1 / np.sqrt(weight / self.block_size)
         elif self.scaling == 'amplitude':  # compensates for the window and the energy loss
             svalue = 1 / wind.sum()
         wind = wind[:, np.newaxis]
@@ -44,9 +44,9 @@ Implement support for multidimensional grids and integration sectors.
 """
 
 # imports from other packages
-import xml.dom.minidom
 from abc import abstractmethod
 from pathlib import Path
+from xml.etree import ElementTree
 
 import numpy as np
 import scipy.linalg as spla
@@ -514,14 +514,14 @@ class RectGrid(Grid):
     def _get_digest(self):
         return digest(self)
 
-    @property_depends_on(['x_min', 'x_max', 'y_min', 'y_max', 'increment'])
+    @property_depends_on(['digest'])
     def _get_pos(self):
-        bpos = np.mgrid[
-            self.x_min : self.x_max : self.nxsteps * 1j,
-            self.y_min : self.y_max : self.nysteps * 1j,
-            self.z : self.z + 0.1,
-        ]
-        bpos.resize((3, self.size))
+        # fill the positions directly, the x coordinate varies slowest
+        nx, ny = self.nxsteps, self.nysteps
+        bpos = np.empty((3, nx * ny))
+        bpos[0] = np.repeat(np.linspace(self.x_min, self.x_max, nx), ny)
+        bpos[1] = np.tile(np.linspace(self.y_min, self.y_max, ny), nx)
+        bpos[2] = self.z
         return bpos
 
     @property_depends_on(['x_min', 'x_max', 'y_min', 'y_max'])
@@ -744,12 +744,12 @@ class RectGrid3D(RectGrid):
 
     @property_depends_on('digest')
     def _get_pos(self):
-        bpos = np.mgrid[
-            self.x_min : self.x_max : self.nxsteps * 1j,
-            self.y_min : self.y_max : self.nysteps * 1j,
-            self.z_min : self.z_max : self.nzsteps * 1j,
-        ]
-        bpos.resize((3, self.size))
+        # fill the positions directly, the x coordinate varies slowest and z fastest
+        nx, ny, nz = self.nxsteps, self.nysteps, self.nzsteps
+        bpos = np.empty((3, nx * ny * nz))
+        bpos[0] = np.repeat(np.linspace(self.x_min, self.x_max, nx), ny * nz)
+        bpos[1] = np.tile(np.repeat(np.linspace(self.y_min, self.y_max, ny), nz), nx)
+        bpos[2] = np.tile(np.linspace(self.z_min, self.z_max, nz), nx * ny)
         return bpos
 
     @cached_property
@@ -1013,14 +1013,12 @@ class ImportGrid(Grid):
         >>> grid.size  # doctest: +SKIP
         12
         """
-        doc = xml.dom.minidom.parse(self.file)
-        names = []
-        xyz = []
-        for el in doc.getElementsByTagName('pos'):
-            names.append(el.getAttribute('subgrid'))
-            xyz.append([float(el.getAttribute(a)) for a in 'xyz'])
-        self._gpos = np.array(xyz, 'd').swapaxes(0, 1)
-        self.subgrids = np.array(names)
+        elements = list(ElementTree.parse(self.file).iter('pos'))
+        gpos = np.empty((3, len(elements)))
+        for row, a in zip(gpos, 'xyz'):
+            row[:] = np.fromiter((float(el.get(a, '')) for el in elements), dtype=float, count=len(elements))
+        self._gpos = gpos
+        self.subgrids = np.array([el.get('subgrid', '') for el in elements])
 
 
 class LineGrid(Grid):
@@ -5,6 +5,7 @@
 """Implements a cache for HDF5 files used in Acoular."""
 
 import gc
+import logging
 from pathlib import Path
 from weakref import WeakValueDictionary
 
@@ -13,6 +14,8 @@ from traits.api import Bool, Delegate, Dict, HasStrictTraits, Instance
 from .configuration import Config, config
 from .h5files import _get_cachefile_class
 
+logger = logging.getLogger(__name__)
+
 
 class HDF5Cache(HasStrictTraits):
     """Cache class that handles opening and closing 'tables.File' objects."""
@@ -73,16 +76,19 @@ class HDF5Cache(HasStrictTraits):
         """Return a list of all used cache directories (if multiple paths exist)."""
         return list({str(k.parent) for k in self.open_file_reference})
 
-    def _print_open_files(self):
-        """Prints open cache files and the number of objects referencing a cache file.
+    def _log_open_files(self):
+        """Logs open cache files and the number of objects referencing a cache file.
 
-        If multiple cache files are open at different paths, the full path is printed.
-        Otherwise, only the filename is logged.
+        If multiple cache files are open at different paths, the full path is logged.
+        Otherwise, only the filename is logged. The message is only built if debug messages of the
+        ``acoular.h5cache`` logger are enabled.
         """
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
         if len(self.open_file_reference.values()) > 1:
-            print(list({str(k): v for k, v in self.open_file_reference.items()}.items()))
+            logger.debug(list({str(k): v for k, v in self.open_file_reference.items()}.items()))
         else:
-            print(list({str(k.name): v for k, v in self.open_file_reference.items()}.items()))
+            logger.debug(list({str(k.name): v for k, v in self.open_file_reference.items()}.items()))
 
     def get_cache_file(self, obj, basename, mode='a'):
         """Returns pytables .h5 file to h5f trait of calling object for caching."""
@@ -116,7 +122,7 @@ class HDF5Cache(HasStrictTraits):
         self.close_unreferenced_cachefiles()
 
         self.busy = False
-        self._print_open_files()
+        self._log_open_files()
 
 
 H5cache = HDF5Cache(config=config)
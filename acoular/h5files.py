@@ -4,13 +4,18 @@
 
 """Implements base classes for handling HDF5 files."""
 
+from pathlib import Path
+from weakref import ref
+
+import numpy as np
+
 from .configuration import config
 
 
 class H5FileBase:
     """Base class for File objects that handle writing and reading of .h5 files."""
 
-    def create_extendable_array(self, nodename, shape, precision, group=None):
+    def create_extendable_array(self, nodename, shape, precision, group=None, chunkshape=None):
         """
         Create an extendable array in the HDF5 file.
 
@@ -24,6 +29,9 @@ class H5FileBase:
             Data type/precision of the array (e.g., 'float32', 'int16').
         group : object, optional
             Group in which to create the array. If None, the root group is used.
+        chunkshape : :class:`tuple` of :class:`int`, optional
+            Shape of the chunks the array is stored in. If None, the chunk shape is chosen
+            automatically by the backend.
         """
 
     def get_data_by_reference(self, nodename, group=None):
@@ -94,6 +102,9 @@ class H5FileBase:
     def create_new_group(self, name, group=None):
         """Create a new group in the HDF5 file."""
 
+    def is_open(self):
+        """Return True if the HDF5 file is open."""
+
 
 class H5CacheFileBase:
     """Base class for File objects that handle writing and reading of .h5 cache files."""
@@ -103,7 +114,7 @@ class H5CacheFileBase:
     def is_cached(self, nodename, group=None):
         """Check if data is cached in the HDF5 file."""
 
-    def create_compressible_array(self, nodename, shape, precision, group=None):
+    def create_compressible_array(self, nodename, shape, precision, group=None, chunkshape=None):
         """Create a compressible array in the HDF5 cache file."""
 
 
@@ -124,12 +135,12 @@ if config.have_tables:
     class H5FileTables(H5FileBase, tables.File):
         """Hdf5 File based on PyTables."""
 
-        def create_extendable_array(self, nodename, shape, precision, group=None):
+        def create_extendable_array(self, nodename, shape, precision, group=None, chunkshape=None):
             """Create an extendable array using PyTables."""
             if not group:
                 group = self.root
             atom = precision_to_atom[precision]
-            self.create_earray(group, nodename, atom, shape)
+            self.create_earray(group, nodename, atom, shape, chunkshape=chunkshape)
 
         def get_data_by_reference(self, nodename, group=None):
             """Get data by reference using PyTables."""
@@ -145,6 +156,10 @@ if config.have_tables:
             """Get an attribute from a PyTables node."""
             return node._v_attrs[attrname]  # noqa: SLF001
 
+        def is_open(self):
+            """Return True if the PyTables file is open."""
+            return bool(self.isopen)
+
         def append_data(self, node, data):
             """Append data to a PyTables node."""
             node.append(data)
@@ -191,12 +206,12 @@ if config.have_tables:
                 group = self.root
             return nodename in group
 
-        def create_compressible_array(self, nodename, shape, precision, group=None):
+        def create_compressible_array(self, nodename, shape, precision, group=None, chunkshape=None):
             """Create a compressible array in PyTables cache file."""
             if not group:
                 group = self.root
             atom = precision_to_atom[precision]
-            self.create_carray(group, nodename, atom, shape, filters=self.compression_filter)
+            self.create_carray(group, nodename, atom, shape, filters=self.compression_filter, chunkshape=chunkshape)
 
 
 if config.have_h5py:
@@ -215,10 +230,12 @@ if config.have_h5py:
             """Create an array in h5py file."""
             self.create_dataset(f'{where}/{name}', data=obj)
 
-        def create_extendable_array(self, nodename, shape, precision, group=None):
+        def create_extendable_array(self, nodename, shape, precision, group=None, chunkshape=None):
             """Create an extendable array using h5py."""
             in_file_path = self._get_in_file_path(nodename, group)
-            self.create_dataset(in_file_path, shape=shape, dtype=precision, maxshape=(None, shape[1]))
+            self.create_dataset(
+                in_file_path, shape=shape, dtype=precision, maxshape=(None, shape[1]), chunks=chunkshape
+            )
 
         def get_data_by_reference(self, nodename, group=None):
             """Get data by reference using h5py."""
@@ -233,6 +250,10 @@ if config.have_h5py:
             """Get an attribute from an h5py node."""
             return node.attrs[attrname]
 
+        def is_open(self):
+            """Return True if the h5py file is open."""
+            return bool(self.id.valid)
+
         def append_data(self, node, data):
             """Append data to an h5py dataset."""
             old_shape = node.shape
@@ -284,7 +305,7 @@ if config.have_h5py:
                 group = '/'
             return group + nodename in self
 
-        def create_compressible_array(self, nodename, shape, precision, group=None):
+        def create_compressible_array(self, nodename, shape, precision, group=None, chunkshape=None):
             """Create a compressible array in h5py cache file."""
             in_file_path = self._get_in_file_path(nodename, group)
             self.create_dataset(
@@ -292,10 +313,21 @@ if config.have_h5py:
                 dtype=precision,
                 shape=shape,
                 compression=self.compression_filter,
-                chunks=True,
+                chunks=chunkshape if chunkshape is not None else True,
             )
 
 
+def _get_row_chunkshape(shape, precision, chunk_size=2**16):
+    """Get a chunk shape of complete rows (first axis) with about ``chunk_size`` bytes."""
+    # cached results are written and read per frequency (row), so that row aligned chunks avoid
+    # accessing the data of other frequencies
+    if 0 in shape:
+        return None
+    row_size = int(np.prod(shape[1:], dtype=np.int64)) * np.dtype(precision).itemsize
+    num_rows = max(1, min(shape[0], chunk_size // max(1, row_size)))
+    return (num_rows, *shape[1:])
+
+
 def _get_h5file_class():
     """Get the appropriate H5File class based on configuration."""
     if config.h5library in ['pytables', 'tables']:
@@ -305,6 +337,58 @@ def _get_h5file_class():
     return None
 
 
+# read-only files shared between objects, keyed by the id of the file object; each entry holds a
+# weak reference to the file object, its key (file class and resolved path), the state of the file
+# on disk when it was opened and the number of objects using it
+_shared_files = {}
+
+
+def _get_file_state(path):
+    """Get the device, inode, size and modification time of a file, which change on rewrites."""
+    stat = path.stat()
+    return (stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+
+def _open_h5file(file):
+    """Open an .h5 file read-only, or share the already open file object for the same path.
+
+    An open file object is only shared if the file has not changed on disk since it was opened.
+    Each call must be matched by a call of :func:`_close_h5file`.
+    """
+    file_class = _get_h5file_class()
+    path = Path(file).resolve()
+    key = (file_class, path)
+    state = _get_file_state(path)
+    for entry in _shared_files.values():
+        h5f = entry['file']()
+        if entry['key'] == key and entry['state'] == state and h5f is not None and h5f.is_open():
+            break
+    else:
+        h5f = file_class(file)
+        file_id = id(h5f)
+        # the entry is removed when the file object is garbage collected
+        entry = _shared_files[file_id] = {
+            'file': ref(h5f, lambda _, file_id=file_id: _shared_files.pop(file_id, None)),
+            'key': key,
+            'state': state,
+            'num_users': 0,
+        }
+    entry['num_users'] += 1
+    return h5f
+
+
+def _close_h5file(h5f):
+    """Release an .h5 file opened with :func:`_open_h5file`, closing it when no longer used."""
+    entry = _shared_files.get(id(h5f))
+    if entry is not None and entry['file']() is h5f:
+        entry['num_users'] -= 1
+        if entry['num_users'] > 0:
+            return
+        del _shared_files[id(h5f)]
+    if h5f.is_open():
+        h5f.close()
+
+
 def _get_cachefile_class():
     """Get the appropriate H5CacheFile class based on configuration."""
     if config.h5library in ['pytables', 'tables']:
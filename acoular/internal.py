@@ -4,26 +4,33 @@
 
 """Implements a digest function for caching of traits based on a unique identifier."""
 
-from hashlib import md5
+from hashlib import blake2b
+
+import numpy as np
 
 
 def digest(obj, name='digest'):
     """Generate a unique digest for the given object based on its traits."""
-    str_ = [str(obj.__class__).encode('UTF-8')]
+    hash_ = blake2b(str(obj.__class__).encode('UTF-8'), digest_size=16)
     for do_ in obj.trait(name).depends_on:
         vobj = obj
         try:
             for i in do_.split('.'):
                 vobj = list(vobj.trait_get(i.rstrip('[]')).values())[0]
-            str_.append(str(vobj).encode('UTF-8'))
+            if isinstance(vobj, np.ndarray) and vobj.dtype != object:
+                # hash the binary data, str() is slow and abbreviates large arrays
+                hash_.update(f'{vobj.dtype.str}{vobj.shape}'.encode())
+                hash_.update(np.ascontiguousarray(vobj).data)
+            else:
+                hash_.update(str(vobj).encode('UTF-8'))
         except:  # noqa: E722
             pass
-    return '_' + md5(b''.join(str_)).hexdigest()
+    return '_' + hash_.hexdigest()
 
 
 def ldigest(obj_list):
     """Generate a unique digest for a list of objects based on their traits."""
-    str_ = []
+    hash_ = blake2b(digest_size=16)
     for i in obj_list:
-        str_.append(str(i.digest).encode('UTF-8'))
-    return '_' + md5(b''.join(str_)).hexdigest()
+        hash_.update(str(i.digest).encode('UTF-8'))
+    return '_' + hash_.hexdigest()
@@ -11,8 +11,8 @@ Implements support for array microphone arrangements.
 """
 
 # imports from other packages
-import xml.dom.minidom
 from pathlib import Path
+from xml.etree import ElementTree
 
 import numpy as np
 from scipy.spatial.distance import cdist
@@ -174,7 +174,8 @@ class MicGeom(HasStrictTraits):
     @cached_property
     def _get_pos(self):
         if len(self.invalid_channels) == 0:
-            return self.pos_total
+            # contiguous rows for each coordinate, no copy if pos_total is already C-contiguous
+            return np.ascontiguousarray(self.pos_total)
         allr = [i for i in range(self.pos_total.shape[-1]) if i not in self.invalid_channels]
         return self.pos_total[:, np.array(allr)]
 
@@ -209,7 +210,7 @@ class MicGeom(HasStrictTraits):
         #
         # Raises
         # ------
-        # xml.parsers.expat.ExpatError
+        # xml.etree.ElementTree.ParseError
         #     If the XML file is malformed or cannot be parsed.
         # ValueError
         #     If the attributes ``x``, ``y``, or ``z`` in any ``<pos>`` element are missing or
@@ -226,13 +227,12 @@ class MicGeom(HasStrictTraits):
         # >>> mg.file = '/path/to/geom2.xml'  # doctest: +SKIP
         # >>> mg.center  # doctest: +SKIP
         # array([0.        , 0.33333333, 0.66666667]) # doctest: +SKIP
-        doc = xml.dom.minidom.parse(self.file)
-        names = []
-        xyz = []
-        for el in doc.getElementsByTagName('pos'):
-            names.append(el.getAttribute('Name'))
-            xyz.append([float(el.getAttribute(a)) for a in 'xyz'])
-        self.pos_total = np.array(xyz, 'd').swapaxes(0, 1)
+        elements = list(ElementTree.parse(self.file).iter('pos'))
+        # fill each coordinate row of the C-contiguous array directly
+        pos_total = np.empty((3, len(elements)))
+        for row, a in zip(pos_total, 'xyz'):
+            row[:] = np.fromiter((float(el.get(a, '')) for el in elements), dtype=float, count=len(elements))
+        self.pos_total = pos_total
 
     def export_mpos(self, filename):
         """
@@ -66,7 +66,7 @@ from .base import SamplesGenerator
 
 # acoular imports
 from .environments import Environment
-from .h5files import H5FileBase, _get_h5file_class
+from .h5files import H5FileBase, _close_h5file, _open_h5file
 from .internal import digest, ldigest
 from .microphones import MicGeom
 from .signals import NoiseGenerator, SignalGenerator
@@ -392,9 +392,8 @@ class TimeSamples(SamplesGenerator):
         # Open the .h5 file and set attributes.
         if self.h5f is not None:
             with contextlib.suppress(OSError):
-                self.h5f.close()
-        file = _get_h5file_class()
-        self.h5f = file(self.file)
+                _close_h5file(self.h5f)
+        self.h5f = _open_h5file(self.file)
         self._load_timedata()
         self._load_metadata()
 
@@ -462,11 +461,58 @@ class TimeSamples(SamplesGenerator):
             msg = 'no samples available'
             raise OSError(msg)
         self._datachecksum  # trigger checksum calculation # noqa: B018
+        # local references avoid trait lookups for every block
+        data = self.data
+        num_samples = self.num_samples
         i = 0
-        while i < self.num_samples:
-            yield self.data[i : num + i]
+        while i < num_samples:
+            yield data[i : num + i]
             i += num
 
+    def read_block(self, start, stop, out=None):
+        """
+        Read a block of time-domain data into a NumPy array.
+
+        In contrast to slicing :attr:`data`, which returns a file node proxy or a view, this method
+        always returns a NumPy array. If an output array is given, the data is read directly into
+        it, avoiding temporary arrays if the data type matches that of the time data.
+
+        Parameters
+        ----------
+        start : :class:`int`
+            Index of the first sample of the block.
+        stop : :class:`int`
+            Index after the last sample of the block.
+        out : :class:`numpy.ndarray`, optional
+            Array of shape (``stop - start``, :attr:`num_channels`) to read the data into. If not
+            given, a new array is returned.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            The block of time-domain data.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from acoular.sources import TimeSamples
+        >>> ts = TimeSamples(data=np.arange(12.0).reshape(6, 2), sample_freq=51200)
+        >>> buf = np.empty((2, 2))
+        >>> ts.read_block(2, 4, out=buf)
+        array([[4., 5.],
+               [6., 7.]])
+        """
+        data = self.data
+        if out is None:
+            return np.array(data[start:stop])
+        if isinstance(data, np.ndarray) or out.dtype != data.dtype or not out.flags.c_contiguous:
+            out[...] = data[start:stop]
+        elif hasattr(data, 'read_direct'):  # h5py dataset
+            data.read_direct(out, np.s_[start:stop])
+        else:  # PyTables array
+            data.read(start, stop, out=out)
+        return out
+
 
 class MaskedTimeSamples(TimeSamples):
     """
@@ -581,9 +627,8 @@ class MaskedTimeSamples(TimeSamples):
             raise OSError(msg)
         if self.h5f is not None:
             with contextlib.suppress(OSError):
-                self.h5f.close()
-        file = _get_h5file_class()
-        self.h5f = file(self.file)
+                _close_h5file(self.h5f)
+        self.h5f = _open_h5file(self.file)
         self._load_timedata()
         self._load_metadata()
 
@@ -652,10 +697,46 @@ class MaskedTimeSamples(TimeSamples):
             msg = 'no samples available'
             raise OSError(msg)
         self._datachecksum  # trigger checksum calculation # noqa: B018
+        # local references avoid trait lookups for every block
+        data = self.data
+        channels = self.channels
         while i < stop:
-            yield self.data[i : min(i + num, stop)][:, self.channels]
+            yield data[i : min(i + num, stop)][:, channels]
             i += num
 
+    def read_block(self, start, stop, out=None):
+        """
+        Read a block of valid time-domain data into a NumPy array.
+
+        The sample indices are counted from :attr:`start` and only the valid channels are read.
+        See :meth:`TimeSamples.read_block` for details.
+
+        Parameters
+        ----------
+        start : :class:`int`
+            Index of the first valid sample of the block.
+        stop : :class:`int`
+            Index after the last valid sample of the block.
+        out : :class:`numpy.ndarray`, optional
+            Array of shape (``stop - start``, :attr:`num_channels`) to read the data into. If not
+            given, a new array is returned.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            The block of valid time-domain data.
+        """
+        first, last = slice(self.start, self.stop).indices(self.num_samples_total)[:2]
+        start = min(first + start, last)
+        stop = min(first + stop, last)
+        if len(self.invalid_channels) == 0:
+            return super().read_block(start, stop, out)
+        block = self.data[start:stop][:, self.channels]
+        if out is None:
+            return block
+        out[...] = block
+        return out
+
 
 class PointSource(SamplesGenerator):
     """
@@ -17,10 +17,13 @@
     PowerSpectraImport
 """
 
+import os
 from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 from scipy import fft
+from scipy.linalg.blas import get_blas_funcs
 from traits.api import (
     ABCHasStrictTraits,
     Bool,
@@ -40,12 +43,25 @@ from traits.api import (
 # acoular imports
 from .base import SamplesGenerator
 from .configuration import config
-from .fastFuncs import calcCSM
 from .h5cache import H5cache
-from .h5files import H5CacheFileBase
+from .h5files import H5CacheFileBase, _get_row_chunkshape
 from .internal import digest
+from .sources import MaskedTimeSamples, TimeSamples
 from .tools.utils import find_basename
 
+#: Number of time samples (blocks times channels) that are transformed in one batched FFT call.
+BATCH_SAMPLES = 2**21
+
+
+def _get_num_threads(workers):
+    # number of threads for a ``workers`` value as used by :mod:`scipy.fft`:
+    # None means one thread, negative values count back from the number of CPUs
+    if workers is None:
+        return 1
+    if workers < 0:
+        return max(1, (os.cpu_count() or 1) + 1 + workers)
+    return max(1, workers)
+
 
 class BaseSpectra(ABCHasStrictTraits):
     """
@@ -118,13 +134,40 @@ class BaseSpectra(ABCHasStrictTraits):
     #: Precision of the FFT, corresponding to NumPy dtypes. Default is ``'complex128'``.
     precision = Enum('complex128', 'complex64', desc='precision of the fft')
 
+    #: The number of workers (threads) to use for the FFT calculation and, in
+    #: :class:`PowerSpectra`, for the eigendecomposition of the CSM.
+    #: If set to a negative value, all available logical CPUs are used.
+    #: Default is ``None``, which relies on the :func:`scipy.fft.rfft` implementation.
+    workers = Union(Int(), None, default_value=None, desc='number of workers to use')
+
     #: A unique identifier for the spectra, based on its properties. (read-only)
     digest = Property(depends_on=['precision', 'block_size', 'window', 'overlap'])
 
+    # Sample frequencies, calculated once for each block size and sampling frequency.
+    _fftfreq = Property()
+
+    # Window function values and their energy (sum of squares), calculated once for each block size
+    # and window.
+    _window_data = Property()
+
     @abstractmethod
     def _get_digest(self):
         """Return internal identifier."""
 
+    @property_depends_on(['block_size', 'source.sample_freq'])
+    def _get__fftfreq(self):
+        if self.source is None:
+            return None
+        freqs = abs(fft.fftfreq(self.block_size, 1.0 / self.source.sample_freq)[: int(self.block_size / 2 + 1)])
+        freqs.flags.writeable = False  # the array is shared between calls
+        return freqs
+
+    @property_depends_on(['block_size', 'window'])
+    def _get__window_data(self):
+        wind = self.window_(self.block_size)
+        wind.flags.writeable = False  # the array is shared between calls
+        return wind, np.dot(wind, wind)
+
     def fftfreq(self):
         """
         Compute and return the Discrete Fourier Transform sample frequencies.
@@ -135,8 +178,8 @@ class BaseSpectra(ABCHasStrictTraits):
         Returns
         -------
         :obj:`numpy.ndarray` or :obj:`None`
-            Array of shape ``(`` :attr:`block_size` ``/ 2 + 1,)`` containing the sample frequencies.
-            If :attr:`source` is not set, returns ``None``.
+            Read-only array of shape ``(`` :attr:`block_size` ``/ 2 + 1,)`` containing the sample
+            frequencies. If :attr:`source` is not set, returns ``None``.
 
         Examples
         --------
@@ -163,9 +206,7 @@ class BaseSpectra(ABCHasStrictTraits):
                22400., 22800., 23200., 23600., 24000., 24400., 24800., 25200.,
                25600.])
         """
-        if self.source is not None:
-            return abs(fft.fftfreq(self.block_size, 1.0 / self.source.sample_freq)[: int(self.block_size / 2 + 1)])
-        return None
+        return self._fftfreq
 
     # generator that yields the time data blocks for every channel (with optional overlap)
     def _get_source_data(self):
@@ -183,6 +224,44 @@ class BaseSpectra(ABCHasStrictTraits):
                 temp[0:bs] = temp[bs:]  # copy to left
                 pos -= bs
 
+    # generator that yields the start indices of the time data blocks
+    def _get_block_starts(self):
+        posinc = self.block_size / self.overlap_
+        stop = self.source.num_samples - self.block_size
+        pos = 0
+        while pos <= stop:
+            yield int(pos)
+            pos += posinc
+
+    # generator that yields stacks of time data blocks with shape (num, block_size, num_channels),
+    # the last stack may hold fewer blocks
+    def _get_source_data_batches(self, num=None, dtype=float):
+        bs = self.block_size
+        nc = self.num_channels
+        if num is None:
+            num = max(1, BATCH_SAMPLES // (bs * nc))  # keep the stack at about 16 MB
+        batch = np.empty((num, bs, nc), dtype=dtype)
+        i = 0
+        # time samples read each block directly into its place in the stack, unless a subclass
+        # processes the samples in its own result()
+        if type(self.source).result in (TimeSamples.result, MaskedTimeSamples.result) and self.source.num_samples >= bs:
+            read_block = self.source.read_block
+            for start in self._get_block_starts():
+                read_block(start, start + bs, out=batch[i])
+                i += 1
+                if i == num:
+                    yield batch
+                    i = 0
+        else:
+            for data in self._get_source_data():
+                batch[i] = data
+                i += 1
+                if i == num:
+                    yield batch
+                    i = 0
+        if i > 0:
+            yield batch[:i]
+
 
 class PowerSpectra(BaseSpectra):
     """
@@ -348,8 +427,10 @@ class PowerSpectra(BaseSpectra):
         Calculate the CSM for the given source data.
 
         This method computes the CSM by performing a block-wise Fast Fourier Transform (FFT) on the
-        source data, applying a window function, and averaging the results. Only the upper
-        triangular part of the matrix is computed for efficiency, and the lower triangular part is
+        source data, applying a window function, and averaging the results. The blocks are
+        processed in stacks, so that the FFT is done in a single call per stack. The cross spectra
+        are accumulated with a Hermitian rank-k update per frequency. Only the lower triangular
+        part of the matrix is computed for efficiency, and the upper triangular part is
         constructed via transposition and complex conjugation.
 
         Returns
@@ -372,23 +453,36 @@ class PowerSpectra(BaseSpectra):
         >>> ps.csm.shape
         (65, 4, 4)
         """
-        t = self.source
-        wind = self.window_(self.block_size)
-        weight = np.dot(wind, wind)
-        wind = wind[np.newaxis, :].swapaxes(0, 1)
-        numfreq = int(self.block_size / 2 + 1)
-        csm_shape = (numfreq, t.num_channels, t.num_channels)
-        csm_upper = np.zeros(csm_shape, dtype=self.precision)
-        # get time data blockwise
-        for data in self._get_source_data():
-            ft = fft.rfft(data * wind, None, 0).astype(self.precision)
-            calcCSM(csm_upper, ft)  # only upper triangular part of matrix is calculated (for speed reasons)
+        # local references avoid trait lookups in the loops
+        bs = self.block_size
+        precision = self.precision
+        workers = self.workers
+        num_channels = self.source.num_channels
+        # real data type matching the precision, so that the FFT directly yields the precision
+        dtype = np.float32 if precision == 'complex64' else np.float64
+        wind, weight = self._window_data
+        wind = wind[:, np.newaxis].astype(dtype)
+        numfreq = int(bs / 2 + 1)
+        csm_shape = (numfreq, num_channels, num_channels)
+        csm = np.zeros(csm_shape, dtype=precision)
+        # Hermitian rank-k update, the transposed csm is passed to get Fortran ordered matrices that
+        # are updated in place; only the lower triangle of csm is calculated (for speed reasons)
+        herk = get_blas_funcs('herk', dtype=precision)
+        csm_t = csm.transpose(0, 2, 1)
+        # get time data as stacks of blocks and transform them in one go, the stacks are filled
+        # anew for each iteration, so the window can be applied in place
+        for batch in self._get_source_data_batches(dtype=dtype):
+            np.multiply(batch, wind, out=batch)
+            ft = fft.rfft(batch, None, 1, workers=workers)
+            # (freqs, channels, blocks) layout, ft[i].T is a Fortran ordered (blocks, channels) view
+            ft = np.ascontiguousarray(ft.transpose(1, 2, 0))
+            for i in range(numfreq):
+                herk(1.0, ft[i].T, beta=1.0, c=csm_t[i], trans=2, overwrite_c=1)
         # create the full csm matrix via transposing and complex conj.
-        csm_lower = csm_upper.conj().transpose(0, 2, 1)
-        [np.fill_diagonal(csm_lower[cntFreq, :, :], 0) for cntFreq in range(csm_lower.shape[0])]
-        csm = csm_lower + csm_upper
-        # onesided spectrum: multiplication by 2.0=sqrt(2)^2
-        return csm * (2.0 / self.block_size / weight / self.num_blocks)
+        csm += np.tril(csm, -1).conj().transpose(0, 2, 1)
+        # onesided spectrum: multiplication by 2.0=sqrt(2)^2, in place to keep the precision
+        csm *= 2.0 / bs / weight / self.num_blocks
+        return csm
 
     def calc_ev(self):
         """
@@ -410,6 +504,8 @@ class PowerSpectra(BaseSpectra):
 
         Notes
         -----
+        - The decompositions for different frequencies are computed in parallel if
+          :attr:`~BaseSpectra.workers` is set.
         - The precision of the eigenvalues is determined by :attr:`~BaseSpectra.precision`
           (``'float64'`` for ``complex128`` precision and ``'float32'`` for ``complex64``
           precision).
@@ -432,12 +528,22 @@ class PowerSpectra(BaseSpectra):
             eva_dtype = 'float64'
         elif self.precision == 'complex64':
             eva_dtype = 'float32'
-        #        csm = self.csm #trigger calculation
-        csm_shape = self.csm.shape
+        csm = self.csm  # trigger calculation
+        csm_shape = csm.shape
         eva = np.empty(csm_shape[0:2], dtype=eva_dtype)
         eve = np.empty(csm_shape, dtype=self.precision)
-        for i in range(csm_shape[0]):
-            (eva[i], eve[i]) = np.linalg.eigh(self.csm[i])
+        # the csm is read in chunks of frequencies, each chunk is split into one stack of matrices
+        # per thread, which is decomposed in a single batched call (LAPACK releases the GIL)
+        num = max(1, BATCH_SAMPLES // (csm_shape[1] * csm_shape[2]))
+        num_threads = _get_num_threads(self.workers)
+        with ThreadPoolExecutor(num_threads) as executor:
+            for start in range(0, csm_shape[0], num):
+                csm_chunk = np.asarray(csm[start : start + num])
+                i = start
+                for w, v in executor.map(np.linalg.eigh, np.array_split(csm_chunk, num_threads)):
+                    eva[i : i + w.shape[0]] = w
+                    eve[i : i + w.shape[0]] = v
+                    i += w.shape[0]
         return (eva, eve)
 
     def calc_eva(self):
@@ -512,12 +618,23 @@ class PowerSpectra(BaseSpectra):
             if config.global_caching == 'readonly':
                 return func()
             #            print("create array, data not cached for",nodename)
-            self.h5f.create_compressible_array(nodename, shape, precision)
+            # chunks hold complete frequencies, as the data is read per frequency
+            chunkshape = _get_row_chunkshape(shape, precision)
+            self.h5f.create_compressible_array(nodename, shape, precision, chunkshape=chunkshape)
+            # flag that marks the data as written, checking it avoids reading the whole array
+            self.h5f.set_node_attribute(self.h5f.get_data_by_reference(nodename), 'complete', False)
 
         ac = self.h5f.get_data_by_reference(nodename)
-        if ac[:].sum() == 0:  # only initialized
+        try:
+            complete = self.h5f.get_node_attribute(ac, 'complete')
+        except KeyError:  # written before the flag was introduced, the data is computed again
+            complete = False
+        if not complete:  # only initialized
+            if config.global_caching == 'readonly':
+                return func()
             #            print("write {} to:".format(traitname),nodename)
             ac[:] = func()
+            self.h5f.set_node_attribute(ac, 'complete', True)
             self.h5f.flush()
         return ac
 
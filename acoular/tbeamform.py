@@ -103,6 +103,7 @@ class BeamformerTime(TimeOut):
     def _get_num_channels(self):
         return self.steer.grid.size
 
+    @cached_property
     def _get_digest(self):
         return digest(self)
 
@@ -7,6 +7,11 @@ import numba as nb
 import numpy as np
 
 
+def _readonly(dtype, ndim, layout='A'):
+    """Array type for the distances, which are shared between steering vectors and read-only."""
+    return nb.types.Array(dtype, ndim, layout, readonly=True)
+
+
 @nb.njit(
     [
         (
@@ -122,8 +127,8 @@ def _delayandsum5(data, offsets, ifactor2, steeramp, out, autopower):
 
 @nb.njit(
     [
-        (nb.float32[:, :, :], nb.float32[:, :], nb.float32[:, :, :]),
-        (nb.float64[:, :, :], nb.float64[:, :], nb.float64[:, :, :]),
+        (_readonly(nb.float32, 3), _readonly(nb.float32, 2), nb.float32[:, :, :]),
+        (_readonly(nb.float64, 3), _readonly(nb.float64, 2), nb.float64[:, :, :]),
     ],
     cache=True,
     parallel=True,
@@ -141,8 +146,8 @@ def _steer_I(rm, r0, amp):  # noqa: ARG001, N802
 
 @nb.njit(
     [
-        (nb.float32[:, :, :], nb.float32[:, :], nb.float32[:, :, :]),
-        (nb.float64[:, :, :], nb.float64[:, :], nb.float64[:, :, :]),
+        (_readonly(nb.float32, 3), _readonly(nb.float32, 2), nb.float32[:, :, :]),
+        (_readonly(nb.float64, 3), _readonly(nb.float64, 2), nb.float64[:, :, :]),
     ],
     cache=True,
     parallel=True,
@@ -161,8 +166,8 @@ def _steer_II(rm, r0, amp):  # noqa: N802
 
 @nb.njit(
     [
-        (nb.float32[:, :, :], nb.float32[:, :], nb.float32[:, :, :]),
-        (nb.float64[:, :, :], nb.float64[:, :], nb.float64[:, :, :]),
+        (_readonly(nb.float32, 3), _readonly(nb.float32, 2), nb.float32[:, :, :]),
+        (_readonly(nb.float64, 3), _readonly(nb.float64, 2), nb.float64[:, :, :]),
     ],
     cache=True,
     parallel=True,
@@ -184,8 +189,8 @@ def _steer_III(rm, r0, amp):  # noqa: N802
 
 @nb.njit(
     [
-        (nb.float32[:, :, :], nb.float32[:, :], nb.float32[:, :, :]),
-        (nb.float64[:, :, :], nb.float64[:, :], nb.float64[:, :, :]),
+        (_readonly(nb.float32, 3), _readonly(nb.float32, 2), nb.float32[:, :, :]),
+        (_readonly(nb.float64, 3), _readonly(nb.float64, 2), nb.float64[:, :, :]),
     ],
     cache=True,
     parallel=True,
@@ -209,8 +214,8 @@ def _steer_IV(rm, r0, amp):  # noqa: ARG001, N802
 
 @nb.njit(
     [
-        (nb.float32[:, :, ::1], nb.float32, nb.float32[:, :, ::1], nb.int32[:, :, ::1]),
-        (nb.float64[:, :, ::1], nb.float64, nb.float64[:, :, ::1], nb.int64[:, :, ::1]),
+        (_readonly(nb.float32, 3, 'C'), nb.float32, nb.float32[:, :, ::1], nb.int32[:, :, ::1]),
+        (_readonly(nb.float64, 3, 'C'), nb.float64, nb.float64[:, :, ::1], nb.int64[:, :, ::1]),
     ],
     cache=True,
     parallel=True,
@@ -95,25 +95,39 @@ def synthetic(data, freqs, f, num=3):
                 h = data[ind]
             res += [h]
     else:
-        # fractional octave bands
-        res = []
-        for i in f:
-            f1 = i * 2.0 ** (-0.5 / num)
-            f2 = i * 2.0 ** (+0.5 / num)
-            ind1 = np.searchsorted(freqs, f1)
-            ind2 = np.searchsorted(freqs, f2)
-            if ind1 == ind2:
-                warn(
-                    f'Queried frequency band ({f1:g} to {f2:g} Hz) does not '
-                    'include any discrete FFT sample frequencies. '
-                    'Returning zeros.',
-                    Warning,
-                    stacklevel=2,
-                )
-                h = np.zeros_like(data[0])
-            else:
-                h = np.sum(data[ind1:ind2], 0)
-            res += [h]
+        # fractional octave bands, the limits of all bands are searched at once
+        f = np.asarray(f, dtype=float)
+        f1 = f * 2.0 ** (-0.5 / num)
+        f2 = f * 2.0 ** (+0.5 / num)
+        ind1 = np.searchsorted(freqs, f1)
+        ind2 = np.searchsorted(freqs, f2)
+        for i in np.flatnonzero(ind1 == ind2):
+            warn(
+                f'Queried frequency band ({f1[i]:g} to {f2[i]:g} Hz) does not '
+                'include any discrete FFT sample frequencies. '
+                'Returning zeros.',
+                Warning,
+                stacklevel=2,
+            )
+        if not isinstance(data, np.ndarray) or data.ndim > 1:
+            # summing up the lines of each band, this only accesses the lines of the bands (e.g. of
+            # a lazily evaluated beamformer result) and is fastest for maps
+            res = [np.zeros_like(data[0]) if i1 == i2 else np.sum(data[i1:i2], 0) for i1, i2 in zip(ind1, ind2)]
+            return np.array(res)
+        # a spectrum (e.g. an integrated map) is summed up for all bands in one call, the band
+        # limits are clipped to the data as by slicing
+        ind1 = np.minimum(ind1, len(data))
+        ind2 = np.minimum(ind2, len(data))
+        res = np.zeros(len(f), dtype=data.dtype)
+        inner = (ind1 < ind2) & (ind2 < len(data))
+        if inner.any():
+            # reduceat yields the sums of data[ind1:ind2] at the positions of the lower limits, the
+            # data is cut after the highest upper limit
+            ind = np.column_stack((ind1[inner], ind2[inner])).ravel()
+            res[inner] = np.add.reduceat(data[: ind.max() + 1], ind)[::2]
+        for i in np.flatnonzero((ind1 < ind2) & (ind2 == len(data))):  # bands up to the last line
+            res[i] = np.sum(data[ind1[i] :])
+        return res
     return np.array(res)
 
 
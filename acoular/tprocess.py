@@ -2568,7 +2568,11 @@ class WriteH5(TimeOut):
         file = _get_h5file_class()
         self.create_filename()
         f5h = file(self.file, mode='w')
-        f5h.create_extendable_array('time_data', (0, self.num_channels), self.precision)
+        # chunks hold complete rows of up to 4096 samples (at most about 1 MB), so that reading a
+        # block of samples for all channels touches only few chunks
+        row_size = self.num_channels * np.dtype(self.precision).itemsize
+        chunkshape = (max(1, min(4096, 2**20 // max(1, row_size))), self.num_channels)
+        f5h.create_extendable_array('time_data', (0, self.num_channels), self.precision, chunkshape=chunkshape)
         ac = f5h.get_data_by_reference('time_data')
         f5h.set_node_attribute(ac, 'sample_freq', self.sample_freq)
         self.add_metadata(f5h)
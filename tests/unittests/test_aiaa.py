@@ -1,4 +1,5 @@
 import acoular as ac
+import numpy as np
 
 
 def test_load_mics(aiaa_bechmark_time_data_file):
@@ -58,3 +59,10 @@ def test_load_trigger(aiaa_bechmark_trigger_file):
     assert trigger_data.num_samples == 480
     assert trigger_data.sample_freq == 48000
     assert trigger_data.data.shape == (trigger_data.num_samples, trigger_data.num_channels)
+
+
+def test_csm_layout(aiaa_bechmark_csm_file):
+    """Test that the imported CSM is C-contiguous and Hermitian."""
+    csm = ac.aiaa.CsmAIAABenchmark(file=aiaa_bechmark_csm_file).csm
+    assert csm.flags['C_CONTIGUOUS']
+    np.testing.assert_allclose(csm, csm.conj().transpose(0, 2, 1), atol=1e-12)
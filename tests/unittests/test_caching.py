@@ -126,3 +126,14 @@ def test_filecache_created(case, file_cache_options):
         ac.config.global_caching = 'none'
         result_uncache = calc(obj2)
         np.testing.assert_allclose(result, result_uncache)
+
+
+def test_log_open_files(tmp_path, monkeypatch, capsys, caplog):
+    """Test that open cache files are logged as debug messages instead of being printed."""
+    monkeypatch.setattr(ac.config, '_cache_dir', str(tmp_path))
+    monkeypatch.setattr(ac.config, 'global_caching', 'individual')
+    ts = ac.TimeSamples(data=np.random.RandomState(1).randn(256, 2), sample_freq=51200)
+    with caplog.at_level('DEBUG', logger='acoular.h5cache'):
+        ac.PowerSpectra(source=ts, block_size=128).csm  # noqa: B018
+    assert capsys.readouterr().out == ''
+    assert any('_cache.h5' in record.getMessage() for record in caplog.records)
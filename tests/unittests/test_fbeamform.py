@@ -0,0 +1,252 @@
+import sys
+from types import ModuleType
+
+import acoular as ac
+import numpy as np
+import pytest
+from traits.api import TraitError
+
+
+@pytest.mark.parametrize('dtype', ['float32', 'float64'])
+def test_L_p(dtype):  # noqa: N802
+    """Test the sound pressure level for arrays and scalars, including non-positive values."""
+    x = np.array([4e-10, 4e-8, 0, -1], dtype=dtype)
+    lp = ac.L_p(x)
+    assert lp.dtype == dtype
+    np.testing.assert_allclose(lp, [0, 20, -350, -350], atol=1e-4)
+    assert ac.L_p(4e-6) == pytest.approx(40)
+    assert ac.L_p(0.0) == pytest.approx(-350)
+
+
+@pytest.mark.parametrize('r_diag', [False, True])
+@pytest.mark.parametrize('num_points', [7, 1000, 5000])
+def test_beamformer_freq(num_points, r_diag):
+    """Test the classic and custom beamformer kernels against a direct evaluation."""
+    rng = np.random.RandomState(3)
+    num_mics = 8
+    a = rng.randn(num_mics, num_mics) + 1j * rng.randn(num_mics, num_mics)
+    csm = a @ a.conj().T
+    dist = 1 + rng.rand(num_points, num_mics)
+    dist0 = 1 + rng.rand(num_points)
+    kj = np.array([10.0])
+    steer = np.exp(-1j * kj[0] * dist) / num_mics
+    csm_ref = csm - np.diag(np.diag(csm)) if r_diag else csm
+    ref = np.einsum('gi,ij,gj->g', steer.conj(), csm_ref, steer).real
+    eva, eve = np.linalg.eigh(csm)
+    for csm_input in (csm, (eva, eve)):
+        result, norm = ac.fastFuncs.beamformerFreq('classic', r_diag, 1.0, (dist0, dist, kj), csm_input)
+        np.testing.assert_allclose(result, ref, rtol=1e-5, atol=1e-5 * np.abs(ref).max())
+        # single precision input
+        csm_input_single = csm_input.astype('complex64') if csm_input is csm else (eva.astype('f'), eve.astype('F'))
+        result, _ = ac.fastFuncs.beamformerFreq('classic', r_diag, 1.0, (dist0, dist, kj), csm_input_single)
+        np.testing.assert_allclose(result, ref, rtol=1e-5, atol=1e-5 * np.abs(ref).max())
+        np.testing.assert_array_equal(norm, 1 / num_mics)
+        # custom steering vectors are evaluated without the single precision phase
+        result, norm = ac.fastFuncs.beamformerFreq('custom', r_diag, 2.0, steer, csm_input)
+        np.testing.assert_allclose(result, 2 * ref, rtol=1e-10, atol=1e-12 * np.abs(ref).max())
+        np.testing.assert_allclose(norm, 1 / num_mics)
+    # subspace of the csm given by some of the eigenvalues, as used by the eigenvalue beamformers
+    csm_sub = (eve[:, 2:5] * eva[2:5]) @ eve[:, 2:5].conj().T
+    csm_sub_ref = csm_sub - np.diag(np.diag(csm_sub)) if r_diag else csm_sub
+    ref = np.einsum('gi,ij,gj->g', steer.conj(), csm_sub_ref, steer).real
+    for steer_type, steer_input in (('classic', (dist0, dist, kj)), ('custom', steer)):
+        result, _ = ac.fastFuncs.beamformerFreq(steer_type, r_diag, 1.0, steer_input, (eva[2:5], eve[:, 2:5]))
+        np.testing.assert_allclose(result, ref, rtol=1e-5, atol=1e-5 * np.abs(ref).max())
+
+
+def test_capon_singular():
+    """Test that the Capon beamformer raises an error for a singular CSM."""
+    mics = ac.MicGeom(pos_total=np.array([[0, 1, 0, -1], [1, 0, -1, 0], [0, 0, 0, 0]], dtype=float))
+    grid = ac.RectGrid(x_min=-1, x_max=1, y_min=-1, y_max=1, z=1, increment=0.5)
+    csm = np.ones((3, 4, 4), dtype=complex)
+    freq_data = ac.PowerSpectraImport(csm=csm, frequencies=[1000.0, 2000.0, 3000.0])
+    bf = ac.BeamformerCapon(freq_data=freq_data, steer=ac.SteeringVector(grid=grid, mics=mics), cached=False)
+    with pytest.raises(np.linalg.LinAlgError, match='singular'):
+        bf.synthetic(2000.0, 0)
+
+
+def test_steer_rm_shared():
+    """Test that steering vectors with the same geometry share the grid to microphone distances."""
+    mics = ac.MicGeom(pos_total=np.array([[0, 1, 0, -1], [1, 0, -1, 0], [0, 0, 0, 0]], dtype=float))
+    grid = ac.RectGrid(x_min=-1, x_max=1, y_min=-1, y_max=1, z=1, increment=0.5)
+    steer = ac.SteeringVector(grid=grid, mics=mics, steer_type='classic')
+    rm = steer.rm
+    assert ac.SteeringVector(grid=grid, mics=mics).rm is rm
+    assert not rm.flags.writeable
+    np.testing.assert_array_equal(rm, ac.Environment()._r(grid.pos, mics.pos))
+    other = ac.SteeringVector(grid=grid, mics=mics, env=ac.UniformFlowEnvironment(ma=0.1))
+    assert other.rm is not rm
+    grid.z = 2
+    assert steer.rm is not rm
+    np.testing.assert_array_equal(steer.rm, ac.Environment()._r(grid.pos, mics.pos))
+    # environments that differ only in their region of interest do not share the distances
+    env = ac.GeneralFlowEnvironment(roi=grid.pos)
+    digest = env.digest
+    env.roi = grid.pos[:, :2]
+    assert env.digest != digest
+
+
+@pytest.mark.parametrize('steer_type', ['classic', 'inverse', 'true level', 'true location'])
+def test_steer_vector(steer_type):
+    """Test the steering vectors against their definition from the transfer functions."""
+    rng = np.random.RandomState(2)
+    mics = ac.MicGeom(pos_total=rng.rand(3, 5) - 0.5)
+    grid = ac.RectGrid(x_min=-1, x_max=1, y_min=-1, y_max=1, z=1, increment=0.5)
+    steer = ac.SteeringVector(grid=grid, mics=mics, steer_type=steer_type)
+    h = steer.transfer(2000.0)
+    norm = np.sum(np.abs(h) ** 2, axis=1)[:, np.newaxis]
+    ref = {
+        'classic': h / np.abs(h) / 5,
+        'inverse': 1 / h.conj() / 5,
+        'true level': h / norm,
+        'true location': h / np.sqrt(5 * norm),
+    }[steer_type]
+    np.testing.assert_allclose(steer.steer_vector(2000.0), ref, rtol=1e-13)
+    np.testing.assert_allclose(steer.steer_vector(2000.0, np.array([3, 7])), ref[[3, 7]], rtol=1e-13)
+
+
+class CustomSteeringVector(ac.SteeringVector):
+    """Steering vector class that is evaluated by the beamformers as custom steering vector."""
+
+
+@pytest.mark.parametrize('workers', [None, 3, -1])
+@pytest.mark.parametrize('beamformer', [ac.BeamformerBase, ac.BeamformerCapon, ac.BeamformerEig, ac.BeamformerMusic])
+def test_beamformer_workers(beamformer, workers):
+    """Test that the result with custom steering vectors is independent of the number of workers."""
+    rng = np.random.RandomState(4)
+    a = rng.randn(6, 5, 5) + 1j * rng.randn(6, 5, 5)
+    freq_data = ac.PowerSpectraImport(csm=a @ a.conj().transpose(0, 2, 1), frequencies=np.arange(1, 7) * 500.0)
+    mics = ac.MicGeom(pos_total=rng.rand(3, 5) - 0.5)
+    grid = ac.RectGrid(x_min=-1, x_max=1, y_min=-1, y_max=1, z=1, increment=0.25)
+    kwargs = {'freq_data': freq_data, 'cached': False}
+    ref = beamformer(steer=CustomSteeringVector(grid=grid, mics=mics), **kwargs)
+    bf = beamformer(steer=CustomSteeringVector(grid=grid, mics=mics), workers=workers, **kwargs)
+    assert bf.digest == ref.digest
+    np.testing.assert_array_equal(bf.result[:], ref.result[:])
+    # the predefined steering vectors are evaluated with single precision phase
+    result = beamformer(steer=ac.SteeringVector(grid=grid, mics=mics), **kwargs).result[:]
+    np.testing.assert_allclose(bf.result[:], result, rtol=1e-5, atol=1e-5 * np.abs(result).max())
+
+
+@pytest.mark.parametrize('beamformer', [ac.BeamformerBase, ac.BeamformerEig, ac.BeamformerMusic])
+def test_beamformer_precision(beamformer):
+    """Test that single precision spectra give the same beamforming result as double precision."""
+    rng = np.random.RandomState(5)
+    ts = ac.TimeSamples(data=rng.randn(4096, 5), sample_freq=51200)
+    mics = ac.MicGeom(pos_total=rng.rand(3, 5) - 0.5)
+    steer = ac.SteeringVector(grid=ac.RectGrid(x_min=-1, x_max=1, y_min=-1, y_max=1, z=1, increment=0.25), mics=mics)
+    results = []
+    for precision in ('complex128', 'complex64'):
+        freq_data = ac.PowerSpectra(source=ts, block_size=128, precision=precision, cached=False)
+        results.append(beamformer(freq_data=freq_data, steer=steer, cached=False).result[:])
+    np.testing.assert_allclose(results[1], results[0], rtol=1e-4, atol=1e-4 * np.abs(results[0]).max())
+
+
+@pytest.mark.parametrize('definite', [True, False])
+def test_capon(monkeypatch, definite):
+    """Test the Capon beamformer and its inverse CSMs against an explicit inversion of the CSM."""
+    beamformer_freq = ac.BeamformerCapon._beamformer_freq
+    csm_inv = {}
+
+    def _beamformer_freq(self, ind, csm_func, normfactor):
+        csm_inv.update((i, csm_func(i)) for i in ind)
+        return beamformer_freq(self, ind, csm_func, normfactor)
+
+    monkeypatch.setattr(ac.BeamformerCapon, '_beamformer_freq', _beamformer_freq)
+    rng = np.random.RandomState(6)
+    a = rng.randn(3, 5, 5) + 1j * rng.randn(3, 5, 5)
+    csm = a @ a.conj().transpose(0, 2, 1)
+    if not definite:  # invertible, but not positive definite, as inverted via LU decomposition
+        csm -= 2 * np.linalg.eigvalsh(csm)[:, 1, np.newaxis, np.newaxis] * np.eye(5)
+    freq_data = ac.PowerSpectraImport(csm=csm, frequencies=[1000.0, 2000.0, 3000.0])
+    mics = ac.MicGeom(pos_total=rng.rand(3, 5) - 0.5)
+    grid = ac.RectGrid(x_min=-1, x_max=1, y_min=-1, y_max=1, z=1, increment=0.5)
+    # custom steering vectors are evaluated without the single precision phase
+    bf = ac.BeamformerCapon(freq_data=freq_data, steer=CustomSteeringVector(grid=grid, mics=mics), cached=False)
+    steer = bf.steer.steer_vector(2000.0)
+    ref = 1 / np.einsum('gi,ij,gj->g', steer.conj(), np.linalg.inv(csm[1]), steer).real / 25
+    np.testing.assert_allclose(bf.synthetic(2000.0).ravel(), ref, rtol=1e-10)
+    # the full Hermitian inverse is passed on, not only its upper triangle
+    np.testing.assert_allclose(csm_inv[1], np.linalg.inv(csm[1]), rtol=1e-10, atol=1e-12)
+
+
+@pytest.mark.skipif(ac.config.have_cupy, reason='CuPy is installed')
+def test_use_gpu_without_cupy():
+    """Test that the evaluation on the GPU cannot be switched on without CuPy."""
+    with pytest.raises(ImportError, match='CuPy'):
+        ac.BeamformerBase(use_gpu=True)
+
+
+@pytest.mark.parametrize(
+    'beamformer',
+    [
+        ac.BeamformerFunctional,
+        ac.BeamformerOrth,
+        ac.BeamformerCleansc,
+        ac.BeamformerClean,
+        ac.BeamformerCMF,
+        ac.BeamformerSODIX,
+        ac.BeamformerGIB,
+        ac.BeamformerGridlessOrth,
+    ],
+)
+def test_use_gpu_unsupported(beamformer):
+    """Test that beamformers that are not evaluated on the GPU reject use_gpu."""
+    with pytest.raises(TraitError):
+        beamformer(use_gpu=True)
+
+
+def fake_cupy():
+    """Return a module that provides the used CuPy functions with NumPy arrays in host memory."""
+    cupy = ModuleType('cupy')
+    for name in ['asarray', 'empty', 'cos', 'sin', 'float32', 'float64', 'complex128']:
+        setattr(cupy, name, getattr(np, name))
+    cupy.asnumpy = np.asarray
+    return cupy
+
+
+@pytest.mark.parametrize('device', ['fake', 'cupy'])
+@pytest.mark.parametrize('steer_type', ['classic', 'inverse', 'true level', 'true location', 'custom'])
+@pytest.mark.parametrize('beamformer', [ac.BeamformerBase, ac.BeamformerCapon, ac.BeamformerEig, ac.BeamformerMusic])
+def test_use_gpu(beamformer, steer_type, device, monkeypatch):
+    """Test that the evaluation on the GPU equals the evaluation on the CPU.
+
+    With device 'fake', the GPU code path runs with a NumPy-backed stand-in for CuPy.
+    """
+    if device == 'cupy':
+        pytest.importorskip('cupy')
+    else:
+        monkeypatch.setitem(sys.modules, 'cupy', fake_cupy())
+    monkeypatch.setattr(ac.fastFuncs, 'GRID_BLOCK_SIZE', 16)
+    rng = np.random.RandomState(4)
+    a = rng.randn(3, 5, 5) + 1j * rng.randn(3, 5, 5)
+    freq_data = ac.PowerSpectraImport(csm=a @ a.conj().transpose(0, 2, 1), frequencies=[500.0, 1000.0, 1500.0])
+    mics = ac.MicGeom(pos_total=rng.rand(3, 5) - 0.5)
+    grid = ac.RectGrid(x_min=-1, x_max=1, y_min=-1, y_max=1, z=1, increment=0.25)
+    if steer_type == 'custom':
+        steer = CustomSteeringVector(grid=grid, mics=mics)
+    else:
+        steer = ac.SteeringVector(grid=grid, mics=mics, steer_type=steer_type)
+    ref = beamformer(freq_data=freq_data, steer=steer, cached=False)
+    bf = beamformer(freq_data=freq_data, steer=steer, cached=False)
+    if device == 'cupy':
+        bf.use_gpu = True
+    else:
+        bf._use_gpu = True  # the check for an installed CuPy package is bypassed
+    # the phase of the predefined steering vectors is evaluated in single precision
+    np.testing.assert_allclose(bf.result[:], ref.result[:], rtol=1e-5, atol=1e-6 * np.abs(ref.result[:]).max())
+
+
+@pytest.mark.parametrize('workers', [None, 2])
+def test_damas_dirty_map(workers, tmp_path, monkeypatch):
+    """Test that DAMAS starts from the delay-and-sum map of the base beamformer."""
+    monkeypatch.setattr(ac.config, '_cache_dir', str(tmp_path))  # the PSF is cached
+    rng = np.random.RandomState(7)
+    a = rng.randn(3, 5, 5) + 1j * rng.randn(3, 5, 5)
+    freq_data = ac.PowerSpectraImport(csm=a @ a.conj().transpose(0, 2, 1), frequencies=[500.0, 1000.0, 1500.0])
+    mics = ac.MicGeom(pos_total=rng.rand(3, 5) - 0.5)
+    grid = ac.RectGrid(x_min=-1, x_max=1, y_min=-1, y_max=1, z=1, increment=0.5)
+    steer = CustomSteeringVector(grid=grid, mics=mics)
+    ref = ac.BeamformerBase(freq_data=freq_data, steer=steer, cached=False).result[:]
+    bf = ac.BeamformerDamas(freq_data=freq_data, steer=steer, n_iter=0, workers=workers, cached=False)
+    np.testing.assert_array_equal(bf.result[:], ref)
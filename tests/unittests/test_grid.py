@@ -101,3 +101,13 @@ def test_export_gpos_all_grids(grid, tmp_path):
     grid.export_gpos(export_file)
     new_grid = ac.ImportGrid(file=export_file)
     assert np.array_equal(grid.pos, new_grid.pos)
+
+
+def test_rectgrid_pos():
+    """Test the point order of RectGrid and that the positions follow changes of all traits."""
+    grid = ac.RectGrid(x_min=-1, x_max=1, y_min=0, y_max=1, z=1, increment=0.5)
+    assert grid.pos.shape == (3, 15)
+    assert np.array_equal(grid.pos[:, 1], [-1, 0.5, 1])
+    assert np.array_equal(grid.pos[:, 3], [-0.5, 0, 1])
+    grid.z = 2
+    assert np.all(grid.pos[2] == 2)
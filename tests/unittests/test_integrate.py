@@ -115,3 +115,14 @@ def test_sector_integration(setup_beamformer_integrate, sector):
     bf_res = bf.synthetic(f)
     assert integration_res.shape == (1,)
     assert integration_res[0] == bf_res.max()
+
+
+def test_sector_integration_frange(setup_power_spectra_integrate, setup_mics_integrate):
+    """Test that the integration over a frequency range does not require a previous calculation."""
+    grid = ac.RectGrid(x_min=-1, x_max=1, y_min=-1, y_max=1, z=1, increment=0.5)
+    steer = ac.SteeringVector(grid=grid, mics=setup_mics_integrate)
+    bf = ac.BeamformerBase(freq_data=setup_power_spectra_integrate, steer=steer, cached=False)
+    sector = ac.RectSector(x_min=-0.5, x_max=0.5, y_min=-0.5, y_max=0.5)
+    f, integration_res = bf.integrate(sector, frange=(1000, 3000))
+    np.testing.assert_array_equal(f, [2000])
+    assert integration_res[0] == pytest.approx(bf.synthetic(2000).reshape(grid.shape)[grid.subdomain(sector)].sum())
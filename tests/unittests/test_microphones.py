@@ -66,3 +66,24 @@ def test_mpos_aperture(micgeom):
     assert np.allclose(
         micgeom.aperture, expected_aperture
     ), f'Expected aperture {expected_aperture}, but got {micgeom.aperture}'
+
+
+def test_pos_contiguous():
+    """Test that the positions are C-contiguous, also if set from a transposed array."""
+    xml_file_path = Path(ac.__file__).parent / 'xml' / 'tub_vogel64.xml'
+    assert ac.MicGeom(file=xml_file_path).pos_total.flags['C_CONTIGUOUS']
+    pos_total = np.array([[0, 1, 0, -1], [1, 0, -1, 0], [0, 0, 0, 0]], dtype=float)
+    mic_geom = ac.MicGeom(pos_total=np.ascontiguousarray(pos_total.T).T)
+    assert mic_geom.pos.flags['C_CONTIGUOUS']
+    assert np.array_equal(mic_geom.pos, pos_total)
+
+
+def test_digest_large_geometry():
+    """Test that the digest depends on all positions, also for large geometries."""
+    pos_total = np.random.RandomState(1).rand(3, 2000)
+    mic_geom = ac.MicGeom(pos_total=pos_total)
+    digest = mic_geom.digest
+    assert ac.MicGeom(pos_total=pos_total.copy()).digest == digest
+    pos_total = pos_total.copy()
+    pos_total[1, 1000] += 1.0
+    assert ac.MicGeom(pos_total=pos_total).digest != digest
@@ -0,0 +1,64 @@
+import acoular as ac
+import numpy as np
+from pytest_cases import parametrize
+
+
+@parametrize('h5library', ['pytables', 'h5py'])
+def test_shared_h5file(tmp_path, monkeypatch, h5library):
+    """Test that objects reading the same file share one file object, which is only closed when
+    no longer used."""
+    monkeypatch.setattr(ac.config, 'h5library', h5library)
+    rng = np.random.RandomState(1)
+    file, other_file = tmp_path / 'data.h5', tmp_path / 'other.h5'
+    ac.WriteH5(source=ac.TimeSamples(data=rng.randn(10, 2), sample_freq=10), file=file).save()
+    ac.WriteH5(source=ac.TimeSamples(data=rng.randn(10, 2), sample_freq=10), file=other_file).save()
+    ts1 = ac.TimeSamples(file=file)
+    ts2 = ac.MaskedTimeSamples(file=file, invalid_channels=[0])
+    h5f = ts1.h5f
+    assert ts2.h5f is h5f
+    # switching one object to another file keeps the shared file open for the other object
+    ts1.file = other_file
+    assert ts1.h5f is not h5f
+    assert h5f.is_open()
+    np.testing.assert_array_equal(next(ts2.result(4)), h5f.get_data_by_reference('time_data')[:4, 1:])
+    ts2.file = other_file
+    assert ts2.h5f is ts1.h5f
+    assert not h5f.is_open()
+    assert not hasattr(ts1.h5f, 'num_users')
+    # a file object that was closed directly is not shared anymore
+    ts1.h5f.close()
+    ts3 = ac.TimeSamples(file=other_file)
+    assert ts3.h5f.is_open()
+    assert ts3.h5f is not ts1.h5f
+    # a file that was replaced on disk is opened again, the old file stays open while it is used
+    new_file = tmp_path / 'new.h5'
+    ac.WriteH5(source=ac.TimeSamples(data=rng.randn(12, 2), sample_freq=10), file=new_file).save()
+    new_file.replace(other_file)
+    ts4 = ac.TimeSamples(file=other_file)
+    assert ts4.h5f is not ts3.h5f
+    assert ts4.num_samples == 12
+    assert ts3.h5f.is_open()
+
+
+@parametrize('h5library', ['pytables', 'h5py'])
+@parametrize('dtype', ['float32', 'float64'])
+def test_read_block(tmp_path, monkeypatch, h5library, dtype):
+    """Test that blocks read from arrays and files equal the sliced time data."""
+    monkeypatch.setattr(ac.config, 'h5library', h5library)
+    data = np.random.RandomState(1).randn(20, 3).astype(dtype)
+    file = tmp_path / 'data.h5'
+    ac.WriteH5(source=ac.TimeSamples(data=data, sample_freq=10), file=file, precision=dtype).save()
+    for ts in (ac.TimeSamples(data=data, sample_freq=10), ac.TimeSamples(file=file)):
+        block = ts.read_block(3, 11)
+        assert isinstance(block, np.ndarray)
+        np.testing.assert_array_equal(block, data[3:11])
+        for out_dtype in ('float32', 'float64'):
+            out = np.empty((8, 3), dtype=out_dtype)
+            assert ts.read_block(3, 11, out=out) is out
+            np.testing.assert_array_equal(out, data[3:11].astype(out_dtype))
+    for invalid_channels in ([], [1]):
+        ts = ac.MaskedTimeSamples(file=file, start=2, stop=15, invalid_channels=invalid_channels)
+        out = np.empty((8, ts.num_channels), dtype=dtype)
+        ts.read_block(3, 11, out=out)
+        np.testing.assert_array_equal(out, data[5:13][:, ts.channels])
+        np.testing.assert_array_equal(ts.read_block(10, 20), data[12:15][:, ts.channels])
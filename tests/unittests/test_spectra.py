@@ -0,0 +1,168 @@
+import acoular as ac
+import numpy as np
+import pytest
+from pytest_cases import fixture, parametrize
+
+
+def csm_reference(data, block_size, window, overlap):
+    """Blockwise reference implementation of the Welch CSM estimate."""
+    wind = window(block_size)
+    step = block_size // overlap
+    csm = 0
+    num = 0
+    for pos in range(0, data.shape[0] - block_size + 1, step):
+        ft = np.fft.rfft(data[pos : pos + block_size] * wind[:, np.newaxis], axis=0)
+        csm = csm + ft[:, :, np.newaxis] * ft[:, np.newaxis, :].conj()
+        num += 1
+    return csm * (2.0 / block_size / np.dot(wind, wind) / num)
+
+
+@fixture(scope='module')
+def time_samples():
+    """Fixture for creating a 5 channel time signal with 19 blocks of 256 samples."""
+    rng = np.random.RandomState(2)
+    return ac.TimeSamples(data=rng.randn(19 * 256, 5), sample_freq=51200)
+
+
+@parametrize('overlap', ['None', '50%', '87.5%'])
+@parametrize('window', ['Rectangular', 'Hanning'])
+def test_calc_csm(time_samples, window, overlap):
+    """Test the CSM against a blockwise reference implementation.
+
+    Parameters
+    ----------
+    time_samples : acoular.TimeSamples
+        TimeSamples instance (fixture).
+    window : str
+        Window function.
+    overlap : str
+        Overlap of the FFT blocks.
+    """
+    ps = ac.PowerSpectra(source=time_samples, block_size=256, window=window, overlap=overlap, cached=False)
+    ref = csm_reference(time_samples.data, 256, ps.window_, ps.overlap_)
+    np.testing.assert_allclose(ps.csm, ref, rtol=1e-10, atol=1e-14)
+
+
+@pytest.mark.parametrize('num', [1, 3, 100])
+def test_source_data_batches(time_samples, num):
+    """Test that the stacked blocks equal the single blocks."""
+    ps = ac.PowerSpectra(source=time_samples, block_size=256, overlap='50%')
+    blocks = np.array([block.copy() for block in ps._get_source_data()])
+    batches = np.concatenate([batch.copy() for batch in ps._get_source_data_batches(num)])
+    assert blocks.shape[0] == ps.num_blocks
+    np.testing.assert_array_equal(batches, blocks)
+
+
+class ScaledTimeSamples(ac.TimeSamples):
+    """Time samples that are processed in result(), scaled by a factor of 2."""
+
+    def result(self, num=128):
+        for block in super().result(num):
+            yield 2 * block
+
+
+def test_source_result_override(time_samples):
+    """Test that the CSM of a source that overrides result() is computed from its result."""
+    ts = ScaledTimeSamples(data=time_samples.data, sample_freq=time_samples.sample_freq)
+    ps = ac.PowerSpectra(source=ts, block_size=256, overlap='50%', cached=False)
+    ref = ac.PowerSpectra(source=time_samples, block_size=256, overlap='50%', cached=False).csm[:]
+    np.testing.assert_allclose(ps.csm[:], 4 * ref, rtol=1e-12, atol=1e-15)
+
+
+def test_workers(time_samples):
+    """Test that the number of FFT workers does not change the CSM."""
+    ps = ac.PowerSpectra(source=time_samples, block_size=256, cached=False)
+    csm = ps.csm
+    ps.workers = -1
+    assert ps.digest == ac.PowerSpectra(source=time_samples, block_size=256).digest
+    np.testing.assert_allclose(ps.calc_csm(), csm, rtol=1e-12, atol=1e-15)
+
+
+@pytest.mark.parametrize('workers', [None, 2, -1])
+def test_calc_ev(time_samples, workers):
+    """Test the eigendecomposition of the CSM for different numbers of workers."""
+    ps = ac.PowerSpectra(source=time_samples, block_size=256, window='Hanning', workers=workers, cached=False)
+    eva, eve = ps.calc_ev()
+    csm = ps.csm
+    np.testing.assert_allclose(eva, np.linalg.eigvalsh(csm), rtol=1e-10, atol=1e-16)
+    # reconstruct the csm from eigenvalues and eigenvectors
+    np.testing.assert_allclose((eve * eva[:, np.newaxis, :]) @ eve.conj().transpose(0, 2, 1), csm, atol=1e-15)
+
+
+def test_precision(time_samples):
+    """Test that the CSM has the requested precision and that single precision is accurate."""
+    ps = ac.PowerSpectra(source=time_samples, block_size=256, window='Hanning', precision='complex64', cached=False)
+    csm = ps.csm
+    assert csm.dtype == np.complex64
+    ref = csm_reference(time_samples.data, 256, ps.window_, ps.overlap_)
+    np.testing.assert_allclose(csm, ref, rtol=0, atol=1e-6 * np.abs(ref).max())
+
+
+def test_fftfreq():
+    """Test that the sample frequencies are cached and follow changes of source and block size."""
+    ts = ac.TimeSamples(data=np.zeros((1024, 2)), sample_freq=51200)
+    ps = ac.PowerSpectra(source=ts, block_size=128)
+    freqs = ps.fftfreq()
+    assert ps.fftfreq() is freqs
+    assert not freqs.flags.writeable
+    np.testing.assert_array_equal(freqs, np.fft.rfftfreq(128, 1 / 51200))
+    ps.block_size = 256
+    np.testing.assert_array_equal(ps.fftfreq(), np.fft.rfftfreq(256, 1 / 51200))
+    ts.sample_freq = 1000
+    np.testing.assert_array_equal(ps.fftfreq(), np.fft.rfftfreq(256, 1 / 1000))
+    assert ac.PowerSpectra().fftfreq() is None
+
+
+def test_window_data():
+    """Test that the window is cached and follows changes of the window and block size."""
+    ps = ac.PowerSpectra(block_size=128, window='Hanning')
+    wind, weight = ps._window_data
+    assert ps._window_data[0] is wind
+    assert not wind.flags.writeable
+    np.testing.assert_array_equal(wind, np.hanning(128))
+    assert weight == pytest.approx(np.dot(wind, wind))
+    ps.block_size = 256
+    np.testing.assert_array_equal(ps._window_data[0], np.hanning(256))
+    ps.window = 'Blackman'
+    np.testing.assert_array_equal(ps._window_data[0], np.blackman(256))
+
+
+@pytest.mark.parametrize('h5library', ['pytables', 'h5py'])
+def test_filecache_complete(tmp_path, monkeypatch, time_samples, h5library):
+    """Test that cached data is only computed once and that incomplete cache nodes are rewritten."""
+    monkeypatch.setattr(ac.config, 'h5library', h5library)
+    monkeypatch.setattr(ac.config, '_cache_dir', str(tmp_path))
+    monkeypatch.setattr(ac.config, 'global_caching', 'individual')
+    ps = ac.PowerSpectra(source=time_samples, block_size=256)
+    csm = ps.csm[:]
+    node = ps.h5f.get_data_by_reference('csm_' + ps.digest)
+    assert ps.h5f.get_node_attribute(node, 'complete')
+    # an incomplete node, e.g. from an interrupted computation, is filled again
+    ps.h5f.set_node_attribute(node, 'complete', False)
+    node[:] = 0
+    ps2 = ac.PowerSpectra(source=time_samples, block_size=256)
+    np.testing.assert_array_equal(ps2.csm[:], csm)
+    # a node without the flag, as written before it was introduced, is filled again
+    attrs = node._v_attrs if h5library == 'pytables' else node.attrs  # noqa: SLF001
+    del attrs['complete']
+    node[:] = 0
+    ps2 = ac.PowerSpectra(source=time_samples, block_size=256)
+    np.testing.assert_array_equal(ps2.csm[:], csm)
+    assert ps2.h5f.get_node_attribute(node, 'complete')
+    # a complete node is not computed again
+    monkeypatch.setattr(ac.PowerSpectra, 'calc_csm', None)
+    ps3 = ac.PowerSpectra(source=time_samples, block_size=256)
+    np.testing.assert_array_equal(ps3.csm[:], csm)
+
+
+@pytest.mark.parametrize('h5library', ['pytables', 'h5py'])
+def test_filecache_chunkshape(tmp_path, monkeypatch, time_samples, h5library):
+    """Test that the chunks of cached data hold complete frequencies."""
+    monkeypatch.setattr(ac.config, 'h5library', h5library)
+    monkeypatch.setattr(ac.config, '_cache_dir', str(tmp_path))
+    monkeypatch.setattr(ac.config, 'global_caching', 'individual')
+    ps = ac.PowerSpectra(source=time_samples, block_size=256)
+    node = ps.csm
+    chunkshape = node.chunkshape if h5library == 'pytables' else node.chunks
+    assert tuple(chunkshape) == (129, 5, 5)  # all 129 frequencies fit into one 64 kB chunk
+    assert ac.h5files._get_row_chunkshape((10, 4096), 'complex128') == (1, 4096)
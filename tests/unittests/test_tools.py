@@ -53,3 +53,30 @@ def test_cart_cyl_transform():
     original_cartesian = np.abs(np.random.RandomState(1).rand(3))
     converted_cartesian = ac.cylToCart(ac.cartToCyl(original_cartesian))
     np.testing.assert_allclose(converted_cartesian, original_cartesian)
+
+
+@parametrize('shape', [(65,), (65, 3, 4)])
+def test_synthetic(shape):
+    """Test the band sums against summing up each band separately."""
+    data = np.random.RandomState(1).rand(*shape)
+    freqs = np.fft.rfftfreq(128, 1 / 12800)
+    # overlapping bands, an empty band, a band up to the highest and a band beyond all frequencies
+    f = [1000, 800, 1300, 5500, 6000, 40000]
+    with pytest.warns(Warning, match='does not include any'):
+        res = ac.synthetic(data, freqs, f, 1)
+    assert res.shape == (len(f), *shape[1:])
+    for h, fc in zip(res, f):
+        ind = (freqs >= fc * 2**-0.5) & (freqs < fc * 2**0.5)
+        np.testing.assert_allclose(h, data[ind].sum(0), rtol=1e-12)
+
+    class LazyData:
+        # data that only supports item access, as the lazily evaluated beamformer result
+        def __getitem__(self, key):
+            return data[key]
+
+    with pytest.warns(Warning, match='does not include any'):
+        np.testing.assert_allclose(ac.synthetic(LazyData(), freqs, f, 1), res, rtol=1e-12)
+
+    # bands beyond data that is shorter than freqs are summed up to the end of the data
+    res = ac.synthetic(data[:40], freqs, [3000, 4000], 1)
+    np.testing.assert_allclose(res, [data[22:40].sum(0), data[29:40].sum(0)], rtol=1e-12)
@@ -33,3 +33,16 @@ def test_metadata(tmp_path, create_time_data_source, acoular_cls, h5library, dat
         assert ts.metadata['test'][()] == data.encode()
     else:
         np.testing.assert_allclose(ts.metadata['test'][()], data)
+
+
+@parametrize('h5library', ['pytables', 'h5py'])
+def test_chunkshape(tmp_path, monkeypatch, create_time_data_source, h5library):
+    """Test that time data is saved in chunks of complete rows and read back correctly."""
+    monkeypatch.setattr(ac.config, 'h5library', h5library)
+    time_data = create_time_data_source(num_channels=2, num_samples=5000)
+    h5 = ac.WriteH5(source=time_data, file=tmp_path / 'chunks.h5')
+    h5.save()
+    ts = ac.TimeSamples(file=h5.file)
+    chunkshape = ts.data.chunkshape if h5library == 'pytables' else ts.data.chunks
+    assert tuple(chunkshape) == (4096, 2)
+    np.testing.assert_allclose(ts.data[:], time_data.data.astype('float32'))